@@ -32,7 +32,7 @@ except ImportError as e:
         RDS_DATABASE = "rds_database"
         VPC = "vpc"
     
-    @dataclass
+    @dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
     class ResourceRequest:
         resource_type: ResourceType
         name: str
@@ -49,6 +49,62 @@ except ImportError as e:
         tags: Optional[Dict[str, str]] = None
         description: Optional[str] = None
 
+# Resource keywords used to pick a mock parse result, checked in priority order
+_KINDS = ("cluster", "bucket", "database")
+
+def _mock_eks_request():
+    return ResourceRequest(
+        resource_type=ResourceType.EKS_CLUSTER,
+        name="analytics-cluster",
+        region="us-west-2",
+        environment="production",
+        node_count=5,
+        kubernetes_version="1.28",
+        tags={"purpose": "analytics", "team": "data"},
+        description="Production EKS cluster for analytics workloads"
+    )
+
+def _mock_s3_request():
+    return ResourceRequest(
+        resource_type=ResourceType.S3_BUCKET,
+        name="customer-data-bucket",
+        region="us-east-1",
+        environment="development",
+        versioning=True,
+        encryption=True,
+        tags={"data-classification": "sensitive"},
+        description="Secure S3 bucket for customer data storage"
+    )
+
+def _mock_rds_request():
+    return ResourceRequest(
+        resource_type=ResourceType.RDS_DATABASE,
+        name="app-database",
+        region="us-east-1",
+        environment="development",
+        engine="mysql",
+        instance_class="db.t3.micro",
+        tags={"purpose": "application"},
+        description="MySQL database for application"
+    )
+
+def _mock_default_request():
+    return ResourceRequest(
+        resource_type=ResourceType.EKS_CLUSTER,
+        name="dev-cluster",
+        region="us-east-1",
+        environment="development",
+        node_count=2,
+        kubernetes_version="1.28",
+        description="Development cluster"
+    )
+
+_MOCK_BUILDERS = {
+    "cluster": _mock_eks_request,
+    "bucket": _mock_s3_request,
+    "database": _mock_rds_request,
+}
+
 def demo_llm_parsing():
     """Demo the LLM parsing functionality (mock mode)"""
     print("🧠 LLM Parsing Demo")
@@ -65,49 +121,9 @@ def demo_llm_parsing():
         print(f"\n{i}. Request: '{request}'")
         
         # Mock parsing (since we don't have real API keys)
-        if "cluster" in request.lower():
-            mock_request = ResourceRequest(
-                resource_type=ResourceType.EKS_CLUSTER,
-                name="analytics-cluster",
-                region="us-west-2",
-                environment="production",
-                node_count=5,
-                kubernetes_version="1.28",
-                tags={"purpose": "analytics", "team": "data"},
-                description="Production EKS cluster for analytics workloads"
-            )
-        elif "bucket" in request.lower():
-            mock_request = ResourceRequest(
-                resource_type=ResourceType.S3_BUCKET,
-                name="customer-data-bucket",
-                region="us-east-1",
-                environment="development",
-                versioning=True,
-                encryption=True,
-                tags={"data-classification": "sensitive"},
-                description="Secure S3 bucket for customer data storage"
-            )
-        elif "database" in request.lower():
-            mock_request = ResourceRequest(
-                resource_type=ResourceType.RDS_DATABASE,
-                name="app-database",
-                region="us-east-1",
-                environment="development",
-                engine="mysql",
-                instance_class="db.t3.micro",
-                tags={"purpose": "application"},
-                description="MySQL database for application"
-            )
-        else:
-            mock_request = ResourceRequest(
-                resource_type=ResourceType.EKS_CLUSTER,
-                name="dev-cluster",
-                region="us-east-1",
-                environment="development",
-                node_count=2,
-                kubernetes_version="1.28",
-                description="Development cluster"
-            )
+        lowered = request.lower()
+        kind = next((k for k in _KINDS if k in lowered), None)
+        mock_request = _MOCK_BUILDERS.get(kind, _mock_default_request)()
         
         print(f"   ✅ Parsed as: {mock_request.resource_type.value}")
         print(f"   📛 Name: {mock_request.name}")
@@ -190,7 +206,7 @@ def demo_github_integration():
     print("=" * 50)
     
     print("📝 This would create a GitHub Pull Request with:")
-    print("   - New feature branch: eks-cluster-production-20240101-120000")
+    print("   - New feature branch: eks-cluster-production-20240101-120000-a1b2c3")
     print("   - Committed files:")
     print("     * crossplane/production/demo-cluster-provider-config.yaml")
     print("     * crossplane/production/demo-cluster-cluster.yaml")
@@ -235,7 +251,7 @@ def demo_complete_workflow():
     print("      ✅ Files organized in crossplane/production/ directory")
     
     print("   6. 🚀 Create GitHub Pull Request")
-    print("      ✅ Branch: eks-cluster-production-20240101-120000")
+    print("      ✅ Branch: eks-cluster-production-20240101-120000-a1b2c3")
     print("      ✅ PR #123: Add EKS Cluster: platform-cluster")
     print("      ✅ URL: https://github.com/your-org/infrastructure/pull/123")
     
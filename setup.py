@@ -11,12 +11,10 @@ this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text()
 
 # Read requirements
-requirements = []
-with open("requirements.txt") as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith("#"):
-            requirements.append(line)
+requirements = [
+    line for line in (raw.strip() for raw in (this_directory / "requirements.txt").read_text(encoding="utf-8").splitlines())
+    if line and not line.startswith("#")
+]
 
 setup(
     name="crossplane-agentic-automation",
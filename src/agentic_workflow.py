@@ -4,21 +4,60 @@ Agentic Workflow for Crossplane Automation
 Main conversational interface that integrates LLM, resource generation, and GitHub PR creation
 """
 
+import argparse
 import os
 import sys
-import argparse
-from typing import Optional, Dict, Any
+import io
+from typing import Optional, Dict, Any, Callable
 from pathlib import Path
 
 from .llm_agent import LLMAgent, ResourceRequest, ResourceType, LLMParsingError
 from .enhanced_resource_generator import EnhancedCrossplaneResourceGenerator
-from .github_integration import GitHubIntegration, GitHubAPIError
+
+_NL = "\n"
+
+def _eks_cluster_pr_section(request: ResourceRequest) -> str:
+    """Configuration summary for EKS cluster PRs"""
+    return f"""
+**EKS Cluster Configuration:**
+- Kubernetes Version: `{request.kubernetes_version or '1.28'}`
+- Node Count: `{request.node_count or 3}`
+- Instance Types: `{request.instance_types or 'Auto-selected based on environment'}`
+"""
+
+def _s3_bucket_pr_section(request: ResourceRequest) -> str:
+    """Configuration summary for S3 bucket PRs"""
+    return f"""
+**S3 Bucket Configuration:**
+- Versioning: `{'Enabled' if request.versioning != False else 'Disabled'}`
+- Encryption: `{'Enabled' if request.encryption != False else 'Disabled'}`
+"""
+
+def _rds_database_pr_section(request: ResourceRequest) -> str:
+    """Configuration summary for RDS database PRs"""
+    return f"""
+**RDS Database Configuration:**
+- Engine: `{request.engine or 'mysql'}`
+- Instance Class: `{request.instance_class or 'Auto-selected'}`
+- Storage: `{request.allocated_storage or 20}GB`
+"""
+
+# Resource-specific "Configuration Summary" builders used in PR descriptions
+_PR_SECTION_BUILDERS: Dict[ResourceType, Callable[[ResourceRequest], str]] = {
+    ResourceType.EKS_CLUSTER: _eks_cluster_pr_section,
+    ResourceType.S3_BUCKET: _s3_bucket_pr_section,
+    ResourceType.RDS_DATABASE: _rds_database_pr_section,
+}
 
 class CrossplaneAgenticWorkflow:
     """Main workflow orchestrator for automated infrastructure provisioning"""
     
     def __init__(self, openai_api_key: str, github_token: str, 
-                 repo_owner: str, repo_name: str, llm_model: str = "gpt-5"):
+                 repo_owner: str, repo_name: str, llm_model: str = "gpt-5",
+                 enable_cache: bool = True, buffered_output: bool = False,
+                 stream_llm: bool = False,
+                 resource_generator: Optional[EnhancedCrossplaneResourceGenerator] = None,
+                 semantic_cache: bool = False, persist_cache: bool = False):
         """
         Initialize the agentic workflow
         
@@ -28,14 +67,28 @@ class CrossplaneAgenticWorkflow:
             repo_owner: GitHub repository owner
             repo_name: GitHub repository name
             llm_model: LLM model to use
+            enable_cache: Reuse parse results for repeated requests instead of calling the LLM again
+            buffered_output: Collect per-request status output and write it out in a few large chunks
+            stream_llm: Stream the LLM response and validate the resource name as soon as it arrives
+            resource_generator: Shared generator to reuse across workflows (a new one is created if omitted)
+            semantic_cache: Also reuse LLM results for rephrasings of a previously parsed request
+            persist_cache: Keep parse results on disk so later runs reuse them
         """
-        self.llm_agent = LLMAgent(openai_api_key, llm_model)
-        self.resource_generator = EnhancedCrossplaneResourceGenerator()
+        # Deferred so that --help and argument errors don't pay for loading the HTTP stack
+        from .github_integration import GitHubIntegration
+        
+        self.llm_agent = LLMAgent(openai_api_key, llm_model, enable_cache=enable_cache,
+                                  enable_semantic_cache=semantic_cache,
+                                  persist_cache=persist_cache)
+        self.resource_generator = resource_generator or EnhancedCrossplaneResourceGenerator()
         self.github = GitHubIntegration(github_token, repo_owner, repo_name)
+        self._log_buffer = io.StringIO() if buffered_output else None
+        self.stream_llm = stream_llm
         
         print(f"🤖 Crossplane Agentic Workflow initialized")
         print(f"   LLM Model: {llm_model}")
         print(f"   Repository: {repo_owner}/{repo_name}")
+        print(f"   Parse Cache: {'Enabled' if enable_cache else 'Disabled'}")
         print("=" * 60)
     
     def run_workflow(self, user_input: str, workflow_id: str = None) -> Dict[str, Any]:
@@ -65,6 +118,45 @@ class CrossplaneAgenticWorkflow:
         # This is a placeholder - in the web app, this would update the global workflow_status dict
         pass
     
+    def _log(self, message: str = ""):
+        """Emit a status line, holding it in the output buffer when buffering is enabled"""
+        if self._log_buffer is None:
+            print(message)
+        else:
+            self._log_buffer.write(message)
+            self._log_buffer.write("\n")
+    
+    def _flush_log(self):
+        """Write any buffered status output to stdout"""
+        if self._log_buffer is None or not self._log_buffer.tell():
+            return
+        
+        sys.stdout.write(self._log_buffer.getvalue())
+        sys.stdout.flush()
+        self._log_buffer.seek(0)
+        self._log_buffer.truncate(0)
+    
+    def _call_llm(self, user_input: str) -> ResourceRequest:
+        """Parse a request with the LLM, streaming the response when enabled"""
+        if not self.stream_llm:
+            return self.llm_agent.parse_request(user_input, fast_path=False)
+        
+        def check_streamed_fields(fields: Dict[str, str]) -> bool:
+            # Validate the name while the rest of the response is still streaming
+            try:
+                partial = ResourceRequest(resource_type=ResourceType(fields["resource_type"]), name=fields["name"])
+            except ValueError:
+                return True
+            
+            self._log(f"   ⏳ Streaming: {fields['resource_type']} '{fields['name']}'")
+            issues = self.resource_generator.validate_request(partial)
+            for issue in issues:
+                self._log(f"      - {issue}")
+            return not issues
+        
+        return self.llm_agent.parse_request_streaming(user_input, on_fields=check_streamed_fields,
+                                                      fast_path=False)
+    
     def process_request(self, user_input: str, auto_create_pr: bool = True) -> Dict[str, Any]:
         """
         Process a natural language infrastructure request
@@ -76,66 +168,73 @@ class CrossplaneAgenticWorkflow:
         Returns:
             Dictionary with processing results
         """
-        print(f"📝 Processing request: {user_input}")
-        print("-" * 40)
+        self._log(f"📝 Processing request: {user_input}")
+        self._log("-" * 40)
         
         try:
             # Step 1: Parse the request using LLM
-            print("🧠 Step 1: Parsing request with LLM...")
+            self._log("🧠 Step 1: Parsing request with LLM...")
+            self._flush_log()
             try:
-                request = self.llm_agent.parse_request(user_input)
+                request = self.llm_agent.try_fast_parse(user_input)
+                if request is not None:
+                    self._log("   ⚡ Matched a request template, skipping the LLM call")
+                else:
+                    request = self._call_llm(user_input)
             except LLMParsingError as e:
-                print(f"   ❌ LLM parsing failed: {e}")
+                self._log(f"   ❌ LLM parsing failed: {e}")
                 return {"status": "error", "message": f"LLM parsing failed: {e}", "paused": True, "stage": "llm_parsing"}
             
-            print(f"   ✅ Parsed as: {request.resource_type.value}")
-            print(f"   📛 Name: {request.name}")
-            print(f"   🌍 Region: {request.region}")
-            print(f"   🏷️  Environment: {request.environment}")
-            
+            fields = [
+                ("✅ Parsed as", request.resource_type.value),
+                ("📛 Name", request.name),
+                ("🌍 Region", request.region),
+                ("🏷️  Environment", request.environment),
+            ]
             if request.node_count:
-                print(f"   🔢 Node Count: {request.node_count}")
+                fields.append(("🔢 Node Count", request.node_count))
             if request.kubernetes_version:
-                print(f"   ⚙️  Kubernetes Version: {request.kubernetes_version}")
+                fields.append(("⚙️  Kubernetes Version", request.kubernetes_version))
+            self._log(_NL.join([f"   {label}: {value}" for label, value in fields]))
             
             # Step 2: Validate the request
-            print("\n🔍 Step 2: Validating request...")
+            self._log("\n🔍 Step 2: Validating request...")
             validation_issues = self.resource_generator.validate_request(request)
             
             if validation_issues:
-                print("   ❌ Validation issues found:")
+                self._log("   ❌ Validation issues found:")
                 for issue in validation_issues:
-                    print(f"      - {issue}")
+                    self._log(f"      - {issue}")
                 return {"status": "error", "issues": validation_issues}
             
-            print("   ✅ Request validation passed")
+            self._log("   ✅ Request validation passed")
             
             # Step 3: Generate suggestions
-            print("\n💡 Step 3: Generating enhancement suggestions...")
+            self._log("\n💡 Step 3: Generating enhancement suggestions...")
             suggestions = self.llm_agent.generate_enhancement_suggestions(request)
             
             if suggestions:
-                print("   💡 Suggestions:")
+                self._log("   💡 Suggestions:")
                 for suggestion in suggestions:
-                    print(f"      - {suggestion}")
+                    self._log(f"      - {suggestion}")
             else:
-                print("   ✅ No additional suggestions")
+                self._log("   ✅ No additional suggestions")
             
             # Step 4: Generate Crossplane configurations
-            print("\n⚙️  Step 4: Generating Crossplane configurations...")
+            self._log("\n⚙️  Step 4: Generating Crossplane configurations...")
             configs = self.resource_generator.generate_from_request(request)
             
-            print(f"   ✅ Generated {len(configs)} configuration objects:")
+            self._log(f"   ✅ Generated {len(configs)} configuration objects:")
             for config_name in configs.keys():
-                print(f"      - {config_name}")
+                self._log(f"      - {config_name}")
             
             # Step 5: Prepare files for GitHub
-            print("\n📁 Step 5: Preparing files...")
+            self._log("\n📁 Step 5: Preparing files...")
             files = self.resource_generator.save_configurations_as_files(request, configs)
             
-            print(f"   ✅ Prepared {len(files)} files:")
+            self._log(f"   ✅ Prepared {len(files)} files:")
             for file_info in files:
-                print(f"      - {file_info['path']}")
+                self._log(f"      - {file_info['path']}")
             
             result = {
                 "status": "success",
@@ -145,32 +244,46 @@ class CrossplaneAgenticWorkflow:
                 "files": files
             }
             
+            # Local copies are written in the background; make sure they're done first
+            self.resource_generator.flush()
+            
             # Step 6: Create GitHub PR if requested
             if auto_create_pr:
-                print("\n🚀 Step 6: Creating GitHub Pull Request...")
+                self._log("\n🚀 Step 6: Creating GitHub Pull Request...")
+                self._flush_log()
                 pr_info = self._create_pr(request, files, suggestions)
                 result["pr_info"] = pr_info
             else:
-                print("\n📝 Skipping PR creation (auto_create_pr=False)")
+                self._log("\n📝 Skipping PR creation (auto_create_pr=False)")
             
             return result
             
         except Exception as e:
-            print(f"❌ Error processing request: {e}")
+            self._log(f"❌ Error processing request: {e}")
             return {"status": "error", "error": str(e)}
+        finally:
+            self._flush_log()
     
     def _create_pr(self, request: ResourceRequest, files: list, 
                   suggestions: list) -> Dict[str, Any]:
         """Create a GitHub pull request"""
         
+        resource_type = request.resource_type
+        type_title = resource_type.value.replace('_', ' ').title()
+        name = request.name
+        environment = request.environment
+        branch_prefix = f"{resource_type.value}-{environment}"
+        
         # Generate PR title and description
-        pr_title = f"Add {request.resource_type.value.replace('_', ' ').title()}: {request.name}"
+        pr_title = f"Add {type_title}: {name}"
         
-        pr_description = f"""## 🤖 Automated Infrastructure Request
+        file_list = _NL.join([f"- `{file['path']}`" for file in files])
+        
+        parts = [f"""## 🤖 Automated Infrastructure Request
 
-**Resource Type**: {request.resource_type.value.replace('_', ' ').title()}
-**Name**: `{request.name}`
-**Environment**: `{request.environment}`
+**Resource Type**: {type_title}
+**Name**: `{name}`
+**Environment**: `{environment}`
 **Region**: `{request.region}`
 
 ### 📋 Request Details
@@ -181,49 +294,33 @@ class CrossplaneAgenticWorkflow:
 
 This PR adds the following Crossplane configurations:
 
-{chr(10).join([f"- `{file['path']}`" for file in files])}
+{file_list}
 
 ### ⚙️ Configuration Summary
 
-"""
+"""]
         
         # Add resource-specific details
-        if request.resource_type == ResourceType.EKS_CLUSTER:
-            pr_description += f"""
-**EKS Cluster Configuration:**
-- Kubernetes Version: `{request.kubernetes_version or '1.28'}`
-- Node Count: `{request.node_count or 3}`
-- Instance Types: `{request.instance_types or 'Auto-selected based on environment'}`
-"""
-        elif request.resource_type == ResourceType.S3_BUCKET:
-            pr_description += f"""
-**S3 Bucket Configuration:**
-- Versioning: `{'Enabled' if request.versioning != False else 'Disabled'}`
-- Encryption: `{'Enabled' if request.encryption != False else 'Disabled'}`
-"""
-        elif request.resource_type == ResourceType.RDS_DATABASE:
-            pr_description += f"""
-**RDS Database Configuration:**
-- Engine: `{request.engine or 'mysql'}`
-- Instance Class: `{request.instance_class or 'Auto-selected'}`
-- Storage: `{request.allocated_storage or 20}GB`
-"""
+        section_builder = _PR_SECTION_BUILDERS.get(resource_type)
+        if section_builder:
+            parts.append(section_builder(request))
         
         # Add suggestions
         if suggestions:
-            pr_description += f"""
+            suggestion_list = _NL.join([f"- {suggestion}" for suggestion in suggestions])
+            parts.append(f"""
 ### 💡 Enhancement Suggestions
 
 The AI agent has identified the following suggestions for consideration:
 
-{chr(10).join([f"- {suggestion}" for suggestion in suggestions])}
-"""
+{suggestion_list}
+""")
         
-        pr_description += f"""
+        parts.append(f"""
 ### 🔍 Review Checklist
 
 - [ ] Resource naming follows organizational conventions
-- [ ] Security configurations are appropriate for `{request.environment}` environment
+- [ ] Security configurations are appropriate for `{environment}` environment
 - [ ] Resource sizing and scaling parameters are reasonable
 - [ ] All required tags and labels are properly set
 - [ ] Environment-specific configurations are correct
@@ -244,24 +341,28 @@ The AI agent has identified the following suggestions for consideration:
 
 ---
 *🤖 This PR was automatically generated by the Crossplane Agentic Workflow*
-        """.strip()
+""")
+        
+        pr_description = "".join(parts).strip()
+        
+        from .github_integration import GitHubAPIError
         
         try:
             pr_result = self.github.create_automated_pr(
                 files=files,
                 pr_title=pr_title,
                 pr_description=pr_description,
-                branch_prefix=f"{request.resource_type.value}-{request.environment}"
+                branch_prefix=branch_prefix
             )
             
-            print("   ✅ Pull Request created successfully!")
-            print(f"   🔗 URL: {pr_result['pull_request']['html_url']}")
-            print(f"   🌿 Branch: {pr_result['branch']}")
+            self._log("   ✅ Pull Request created successfully!")
+            self._log(f"   🔗 URL: {pr_result['pull_request']['html_url']}")
+            self._log(f"   🌿 Branch: {pr_result['branch']}")
             
             return pr_result
             
         except GitHubAPIError as e:
-            print(f"   ❌ Failed to create PR: {e}")
+            self._log(f"   ❌ Failed to create PR: {e}")
             return {"status": "error", "error": str(e)}
     
     def interactive_mode(self):
@@ -302,9 +403,8 @@ The AI agent has identified the following suggestions for consideration:
             except Exception as e:
                 print(f"❌ Unexpected error: {e}\n")
 
-def main():
-    """Main entry point"""
-    
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(
         description="Crossplane Agentic Workflow - Natural Language Infrastructure Provisioning",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -351,8 +451,21 @@ Examples:
                        help="LLM model to use")
     parser.add_argument("--no-pr", action="store_true",
                        help="Don't create GitHub PR automatically")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Always call the LLM, even for previously parsed requests")
+    parser.add_argument("--semantic-cache", action="store_true",
+                       help="Reuse cached parses for rephrasings of earlier requests")
+    parser.add_argument("--persist-cache", action="store_true",
+                       help="Keep parsed requests on disk so later runs reuse them")
+    parser.add_argument("--stream", action="store_true",
+                       help="Stream the LLM response and validate it as it arrives")
     
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main entry point"""
+    
+    args = _build_parser().parse_args()
     
     # Validate required credentials
     missing_creds = []
@@ -372,6 +485,12 @@ Examples:
         print("\nPlease provide credentials via command line arguments or environment variables.")
         sys.exit(1)
     
+    # Show LLM and GitHub progress on the console; the libraries log quietly by default
+    from .github_integration import enable_console_logging
+    from .llm_agent import enable_console_logging as enable_llm_console_logging
+    enable_console_logging()
+    enable_llm_console_logging()
+    
     try:
         # Initialize workflow
         workflow = CrossplaneAgenticWorkflow(
@@ -379,7 +498,11 @@ Examples:
             github_token=args.github_token,
             repo_owner=args.repo_owner,
             repo_name=args.repo_name,
-            llm_model=args.llm_model
+            llm_model=args.llm_model,
+            enable_cache=not args.no_cache,
+            stream_llm=args.stream,
+            semantic_cache=args.semantic_cache,
+            persist_cache=args.persist_cache
         )
         
         if args.interactive:
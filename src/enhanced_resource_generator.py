@@ -4,55 +4,314 @@ Enhanced Crossplane Resource Generator
 Integrates with LLM agent for intelligent resource generation
 """
 
+import atexit
+import io
+import os
 import yaml
 import re
+import sys
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from string import Template
+from types import MappingProxyType
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Dict, Any, List, Optional, Tuple, TypedDict
 from datetime import datetime
 import json
+import logging
 
 from .llm_agent import ResourceRequest, ResourceType
+from .yaml_support import Dumper as _Dumper
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+class ManifestMetadata(TypedDict, total=False):
+    """Metadata block of a generated Crossplane manifest"""
+    name: str
+    labels: Dict[str, str]
+    annotations: Dict[str, str]
+
+class CrossplaneManifest(TypedDict):
+    """Shape of a single generated Crossplane manifest"""
+    apiVersion: str
+    kind: str
+    metadata: ManifestMetadata
+    spec: Dict[str, Any]
+
+# Label keys/values and API versions repeated across every generated manifest.
+# Interned so dict building and YAML emission compare them by identity.
+_MANAGED_BY = sys.intern("managed-by")
+_CROSSPLANE_AUTOMATION = sys.intern("crossplane-automation")
+_AWS_API_VERSION = sys.intern("aws.crossplane.io/v1beta1")
+_EKS_API_VERSION = sys.intern("eks.aws.crossplane.io/v1alpha1")
+_S3_API_VERSION = sys.intern("s3.aws.crossplane.io/v1beta1")
+_RDS_API_VERSION = sys.intern("rds.aws.crossplane.io/v1alpha1")
+_EC2_API_VERSION = sys.intern("ec2.aws.crossplane.io/v1beta1")
+
+# (epoch second, ISO timestamp) of the last formatted creation time
+_now_cache = (0, "")
+
+def _now_iso() -> str:
+    """Current local time in ISO format at one-second precision, formatted at most once per second"""
+    global _now_cache
+    second = int(time.time())
+    cached_second, formatted = _now_cache
+    if second != cached_second:
+        formatted = datetime.fromtimestamp(second).isoformat()
+        _now_cache = (second, formatted)
+    return formatted
+
+# Helm-style value references embedded in generated configurations, compiled once
+_VALUES_REF_TEMPLATE = Template("{{ .Values.${environment}.${key} }}")
+_ROLE_ARN_TEMPLATE = Template("arn:aws:iam::{{ .Values.awsAccountId }}:role/${role}-${environment}")
+
+@lru_cache(maxsize=256)
+def _values_ref(environment: str, key: str) -> str:
+    """Reference to a per-environment Helm value, e.g. {{ .Values.production.kmsKeyArn }}"""
+    return _VALUES_REF_TEMPLATE.substitute(environment=environment, key=key)
+
+@lru_cache(maxsize=64)
+def _role_arn(role: str, environment: str) -> str:
+    """IAM role ARN for a per-environment role in the configured AWS account"""
+    return _ROLE_ARN_TEMPLATE.substitute(role=role, environment=environment)
+
+# Deployments only ever use a small set of distinct tag keys
+@lru_cache(maxsize=512)
+def _titleize(key: str) -> str:
+    """Convert a user tag key such as cost_center to Cost-Center"""
+    return key.replace("_", "-").title()
+
+# Validation patterns
+_K8S_VERSION_RE = re.compile(r'^\d+\.\d+(\.\d+)?$')
+_S3_NAME_RE = re.compile(r'^[a-z0-9.-]+$')
+_NAME_SEPARATORS = str.maketrans('', '', '-_')
+
+@dataclass(frozen=True)
+class _EnvironmentProfile:
+    """Environment-specific defaults, resolved once per request instead of branching per field"""
+    public_endpoint: bool
+    node_taints: Callable[[], List[Dict[str, str]]]
+    default_instance_types: Tuple[str, ...]
+    default_db_instance_class: str
+    multi_az: bool
+    backup_retention_days: int
+    auto_minor_version_upgrade: bool
+    deletion_protection: bool
+    eks_addons: bool
+
+def _production_taints() -> List[Dict[str, str]]:
+    """Taints that keep general workloads off production nodes (a fresh list per manifest)"""
+    return [
+        {
+            "key": "node.kubernetes.io/production",
+            "value": "true",
+            "effect": "NoSchedule"
+        }
+    ]
+
+_DEVELOPMENT_PROFILE = _EnvironmentProfile(
+    public_endpoint=True,
+    node_taints=list,
+    default_instance_types=("t3.medium", "t3.large"),
+    default_db_instance_class="db.t3.micro",
+    multi_az=False,
+    backup_retention_days=1,
+    auto_minor_version_upgrade=True,
+    deletion_protection=False,
+    eks_addons=False
+)
+
+_ENV_PROFILES = {
+    "production": _EnvironmentProfile(
+        public_endpoint=False,
+        node_taints=_production_taints,
+        default_instance_types=("m6i.large", "m6i.xlarge", "m5.large", "m5.xlarge"),
+        default_db_instance_class="db.t3.medium",
+        multi_az=True,
+        backup_retention_days=7,
+        auto_minor_version_upgrade=False,
+        deletion_protection=True,
+        eks_addons=True
+    ),
+    "staging": _EnvironmentProfile(
+        public_endpoint=True,
+        node_taints=list,
+        default_instance_types=("m6i.large", "m5.large", "t3.large"),
+        default_db_instance_class="db.t3.small",
+        multi_az=False,
+        backup_retention_days=1,
+        auto_minor_version_upgrade=True,
+        deletion_protection=False,
+        eks_addons=False
+    ),
+    "development": _DEVELOPMENT_PROFILE,
+}
+
+def _env_profile(environment: str) -> _EnvironmentProfile:
+    """Profile for an environment; unknown environments get development defaults"""
+    return _ENV_PROFILES.get(environment, _DEVELOPMENT_PROFILE)
+
+# Default engine versions for RDS instances
+_ENGINE_VERSIONS = MappingProxyType({
+    "mysql": "8.0.35",
+    "postgres": "15.4",
+    "mariadb": "10.11.5"
+})
+_DEFAULT_ENGINE_VERSION = "8.0.35"
+
+# Configurations produced by _generate_eks_addons
+_EKS_ADDON_SECTIONS = frozenset({"aws_load_balancer_controller", "ebs_csi_driver"})
+
+# Generator used inside generate_batch worker processes, created on first use
+_BATCH_GENERATOR = None
+
+def _generate_for_batch(request: ResourceRequest) -> Dict[str, CrossplaneManifest]:
+    """Worker-process entry point for generate_batch"""
+    global _BATCH_GENERATOR
+    if _BATCH_GENERATOR is None:
+        _BATCH_GENERATOR = EnhancedCrossplaneResourceGenerator()
+    return _BATCH_GENERATOR.generate_from_request(request)
+
+# Maximum number of generated files waiting to be written by the background writer
+WRITE_QUEUE_SIZE = 1024
+
+def _write_file(filepath: Path, data: bytes) -> None:
+    """Write a generated file straight to its descriptor, without a buffering layer"""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+class _AsyncWriter:
+    """Writes generated files on a background thread so callers don't wait on disk I/O"""
+    
+    def __init__(self, maxsize: int = WRITE_QUEUE_SIZE):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, filepath: Path, data: bytes) -> Future:
+        """Queue a file to be written, starting the writer thread on first use"""
+        if self._thread is None:
+            self._start()
+        future = Future()
+        self._queue.put((filepath, data, future))
+        return future
+    
+    def join(self) -> None:
+        """Block until every queued file has been written or has failed"""
+        self._queue.join()
+    
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="crossplane-file-writer", daemon=True)
+            self._thread.start()
+            # Don't lose queued files when the process exits before an explicit flush
+            atexit.register(self.join)
+    
+    def _run(self) -> None:
+        while True:
+            filepath, data, future = self._queue.get()
+            try:
+                _write_file(filepath, data)
+            except OSError as e:
+                logger.error("⚠️  Failed to write %s: %s", filepath, e)
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+            finally:
+                self._queue.task_done()
+
+# One writer thread for the whole process, shared by every generator instance
+_WRITER = _AsyncWriter()
 
 class EnhancedCrossplaneResourceGenerator:
     """Enhanced generator that works with LLM-parsed requests"""
     
     def __init__(self, output_dir: str = "generated"):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        
-    def generate_from_request(self, request: ResourceRequest) -> Dict[str, Any]:
+        self._output_dir_created = False
+        self._writer = _WRITER
+        # Writes queued by the calling thread since its last flush(); a generator shared by
+        # concurrent workflows must not make one workflow wait on, or fail for, another's files
+        self._pending = threading.local()
+        
+    def generate_from_request(self, request: ResourceRequest,
+                              sections: Optional[AbstractSet[str]] = None) -> Dict[str, CrossplaneManifest]:
         """
         Generate Crossplane configurations from a ResourceRequest
         
         Args:
             request: Parsed resource request from LLM agent
+            sections: Configuration names to generate (e.g. {"cluster", "node_group"}); all when None
             
         Returns:
             Dictionary of configuration objects
         """
-        if request.resource_type == ResourceType.EKS_CLUSTER:
-            return self._generate_eks_cluster(request)
-        elif request.resource_type == ResourceType.S3_BUCKET:
-            return self._generate_s3_bucket(request)
-        elif request.resource_type == ResourceType.RDS_DATABASE:
-            return self._generate_rds_database(request)
-        elif request.resource_type == ResourceType.VPC:
-            return self._generate_vpc(request)
-        else:
+        handler = self._DISPATCH.get(request.resource_type)
+        if handler is None:
             raise ValueError(f"Unsupported resource type: {request.resource_type}")
+        
+        # One timestamp for every configuration generated from this request
+        configurations = handler(self, request, _now_iso(), sections)
+        if sections is not None:
+            configurations = {name: config for name, config in configurations.items() if name in sections}
+        return configurations
+    
+    def generate_batch(self, requests: List[ResourceRequest],
+                       max_workers: Optional[int] = None) -> List[Dict[str, CrossplaneManifest]]:
+        """
+        Generate configurations for many requests in parallel worker processes
+        
+        Building the config dicts is CPU-bound Python, so a process pool scales across
+        cores where threads would serialize on the GIL. Single requests are generated
+        in-process to avoid the pool start-up cost.
+        
+        Args:
+            requests: Parsed resource requests
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Plain configuration dictionaries, in the same order as requests, whichever
+            path generated them
+        """
+        if len(requests) < 2:
+            return [self.generate_from_request(request) for request in requests]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(requests))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_generate_for_batch, requests))
     
-    def _generate_eks_cluster(self, request: ResourceRequest) -> Dict[str, Any]:
+    def _generate_eks_cluster(self, request: ResourceRequest, created_at: str,
+                              sections: Optional[AbstractSet[str]] = None) -> Dict[str, CrossplaneManifest]:
         """Generate EKS cluster configuration from request"""
         
+        profile = _env_profile(request.environment)
+        
+        # Values repeated in the cluster and node group documents; each document gets its own containers
+        provider_config_name = f"{request.name}-provider-config"
+        subnet_1 = _values_ref(request.environment, "privateSubnet1Id")
+        subnet_2 = _values_ref(request.environment, "privateSubnet2Id")
+        
         # Provider configuration
         provider_config = {
-            "apiVersion": "aws.crossplane.io/v1beta1",
+            "apiVersion": _AWS_API_VERSION,
             "kind": "ProviderConfig",
             "metadata": {
-                "name": f"{request.name}-provider-config",
+                "name": provider_config_name,
                 "labels": {
                     "environment": request.environment,
-                    "managed-by": "crossplane-automation"
+                    _MANAGED_BY: _CROSSPLANE_AUTOMATION
                 }
             },
             "spec": {
@@ -68,26 +327,18 @@ class EnhancedCrossplaneResourceGenerator:
         }
         
         # Prepare tags
-        tags = {
-            "Environment": request.environment,
-            "CreatedBy": "crossplane-automation",
-            "CreatedAt": datetime.now().isoformat(),
-            "Owner": "platform-team"
-        }
-        
-        if request.tags:
-            tags.update({k.replace("_", "-").title(): v for k, v in request.tags.items()})
+        tags = self._normalize_tags(request, created_at, Owner="platform-team")
         
         # EKS Cluster
         cluster = {
-            "apiVersion": "eks.aws.crossplane.io/v1alpha1",
+            "apiVersion": _EKS_API_VERSION,
             "kind": "Cluster",
             "metadata": {
                 "name": request.name,
                 "labels": {
                     "environment": request.environment,
                     "region": request.region,
-                    "managed-by": "crossplane-automation"
+                    _MANAGED_BY: _CROSSPLANE_AUTOMATION
                 },
                 "annotations": {
                     "crossplane.io/external-name": request.name
@@ -96,21 +347,18 @@ class EnhancedCrossplaneResourceGenerator:
             "spec": {
                 "forProvider": {
                     "region": request.region,
-                    "roleArn": f"arn:aws:iam::{{{{ .Values.awsAccountId }}}}:role/eks-cluster-role-{request.environment}",
+                    "roleArn": _role_arn("eks-cluster-role", request.environment),
                     "version": request.kubernetes_version or "1.28",
                     "resourcesVpcConfig": {
-                        "securityGroupIds": [f"{{{{ .Values.{request.environment}.securityGroupId }}}}"],
-                        "subnetIds": [
-                            f"{{{{ .Values.{request.environment}.privateSubnet1Id }}}}",
-                            f"{{{{ .Values.{request.environment}.privateSubnet2Id }}}}"
-                        ],
+                        "securityGroupIds": [_values_ref(request.environment, "securityGroupId")],
+                        "subnetIds": [subnet_1, subnet_2],
                         "endpointConfigPrivateAccess": True,
-                        "endpointConfigPublicAccess": request.environment != "production"
+                        "endpointConfigPublicAccess": profile.public_endpoint
                     },
                     "encryptionConfig": {
                         "resources": ["secrets"],
                         "provider": {
-                            "keyArn": f"{{{{ .Values.{request.environment}.kmsKeyArn }}}}"
+                            "keyArn": _values_ref(request.environment, "kmsKeyArn")
                         }
                     },
                     "logging": {
@@ -124,17 +372,17 @@ class EnhancedCrossplaneResourceGenerator:
                     "tags": tags
                 },
                 "providerConfigRef": {
-                    "name": f"{request.name}-provider-config"
+                    "name": provider_config_name
                 }
             }
         }
         
         # Node Group configuration
-        instance_types = request.instance_types or self._get_default_instance_types(request.environment)
+        instance_types = request.instance_types or list(profile.default_instance_types)
         node_count = request.node_count or 3
         
         node_group = {
-            "apiVersion": "eks.aws.crossplane.io/v1alpha1",
+            "apiVersion": _EKS_API_VERSION,
             "kind": "NodeGroup",
             "metadata": {
                 "name": f"{request.name}-node-group",
@@ -146,11 +394,8 @@ class EnhancedCrossplaneResourceGenerator:
             "spec": {
                 "forProvider": {
                     "clusterName": request.name,
-                    "nodeRole": f"arn:aws:iam::{{{{ .Values.awsAccountId }}}}:role/eks-node-group-role-{request.environment}",
-                    "subnets": [
-                        f"{{{{ .Values.{request.environment}.privateSubnet1Id }}}}",
-                        f"{{{{ .Values.{request.environment}.privateSubnet2Id }}}}"
-                    ],
+                    "nodeRole": _role_arn("eks-node-group-role", request.environment),
+                    "subnets": [subnet_1, subnet_2],
                     "instanceTypes": instance_types,
                     "scalingConfig": {
                         "minSize": max(1, node_count - 1),
@@ -165,13 +410,7 @@ class EnhancedCrossplaneResourceGenerator:
                         "node.kubernetes.io/role": "application",
                         "environment": request.environment
                     },
-                    "taints": [] if request.environment != "production" else [
-                        {
-                            "key": "node.kubernetes.io/production",
-                            "value": "true",
-                            "effect": "NoSchedule"
-                        }
-                    ],
+                    "taints": profile.node_taints(),
                     "tags": {
                         "Environment": request.environment,
                         "Cluster": request.name,
@@ -179,7 +418,7 @@ class EnhancedCrossplaneResourceGenerator:
                     }
                 },
                 "providerConfigRef": {
-                    "name": f"{request.name}-provider-config"
+                    "name": provider_config_name
                 }
             }
         }
@@ -191,33 +430,55 @@ class EnhancedCrossplaneResourceGenerator:
             "node_group": node_group
         }
         
-        if request.environment == "production":
+        if profile.eks_addons and (sections is None or not sections.isdisjoint(_EKS_ADDON_SECTIONS)):
             configurations.update(self._generate_eks_addons(request))
         
         return configurations
     
-    def _generate_s3_bucket(self, request: ResourceRequest) -> Dict[str, Any]:
+    def _generate_s3_bucket(self, request: ResourceRequest, created_at: str,
+                            sections: Optional[AbstractSet[str]] = None) -> Dict[str, CrossplaneManifest]:
         """Generate S3 bucket configuration from request"""
         
         # Prepare tags
-        tags = {
-            "Environment": request.environment,
-            "CreatedBy": "crossplane-automation",
-            "CreatedAt": datetime.now().isoformat()
-        }
-        
-        if request.tags:
-            tags.update({k.replace("_", "-").title(): v for k, v in request.tags.items()})
+        tags = self._normalize_tags(request, created_at)
+        
+        # KMS when encryption was requested, AES256 by default, none when explicitly disabled
+        if request.encryption:
+            sse_configuration = {
+                "rules": [
+                    {
+                        "applyServerSideEncryptionByDefault": {
+                            "sseAlgorithm": "aws:kms",
+                            "kmsMasterKeyID": _values_ref(request.environment, "kmsKeyArn")
+                        },
+                        "bucketKeyEnabled": True
+                    }
+                ]
+            }
+        elif request.encryption is None:
+            sse_configuration = {
+                "rules": [
+                    {
+                        "applyServerSideEncryptionByDefault": {
+                            "sseAlgorithm": "AES256",
+                            "kmsMasterKeyID": None
+                        },
+                        "bucketKeyEnabled": False
+                    }
+                ]
+            }
+        else:
+            sse_configuration = {}
         
         bucket = {
-            "apiVersion": "s3.aws.crossplane.io/v1beta1",
+            "apiVersion": _S3_API_VERSION,
             "kind": "Bucket",
             "metadata": {
                 "name": request.name,
                 "labels": {
                     "environment": request.environment,
                     "region": request.region,
-                    "managed-by": "crossplane-automation"
+                    _MANAGED_BY: _CROSSPLANE_AUTOMATION
                 }
             },
             "spec": {
@@ -227,17 +488,7 @@ class EnhancedCrossplaneResourceGenerator:
                     "versioningConfiguration": {
                         "status": "Enabled" if request.versioning != False else "Suspended"
                     },
-                    "serverSideEncryptionConfiguration": {
-                        "rules": [
-                            {
-                                "applyServerSideEncryptionByDefault": {
-                                    "sseAlgorithm": "AES256" if not request.encryption else "aws:kms",
-                                    "kmsMasterKeyID": f"{{{{ .Values.{request.environment}.kmsKeyArn }}}}" if request.encryption else None
-                                },
-                                "bucketKeyEnabled": True if request.encryption else False
-                            }
-                        ]
-                    } if request.encryption != False else {},
+                    "serverSideEncryptionConfiguration": sse_configuration,
                     "publicAccessBlockConfiguration": {
                         "blockPublicAcls": True,
                         "blockPublicPolicy": True,
@@ -279,33 +530,27 @@ class EnhancedCrossplaneResourceGenerator:
         
         return {"bucket": bucket}
     
-    def _generate_rds_database(self, request: ResourceRequest) -> Dict[str, Any]:
+    def _generate_rds_database(self, request: ResourceRequest, created_at: str,
+                               sections: Optional[AbstractSet[str]] = None) -> Dict[str, CrossplaneManifest]:
         """Generate RDS database configuration from request"""
         
         engine = request.engine or "mysql"
-        instance_class = request.instance_class or self._get_default_db_instance_class(request.environment)
+        profile = _env_profile(request.environment)
+        instance_class = request.instance_class or profile.default_db_instance_class
         allocated_storage = request.allocated_storage or 20
         
         # Prepare tags
-        tags = {
-            "Environment": request.environment,
-            "CreatedBy": "crossplane-automation",
-            "CreatedAt": datetime.now().isoformat(),
-            "Engine": engine
-        }
-        
-        if request.tags:
-            tags.update({k.replace("_", "-").title(): v for k, v in request.tags.items()})
+        tags = self._normalize_tags(request, created_at, Engine=engine)
         
         database = {
-            "apiVersion": "rds.aws.crossplane.io/v1alpha1",
+            "apiVersion": _RDS_API_VERSION,
             "kind": "RDSInstance",
             "metadata": {
                 "name": request.name,
                 "labels": {
                     "environment": request.environment,
                     "engine": engine,
-                    "managed-by": "crossplane-automation"
+                    _MANAGED_BY: _CROSSPLANE_AUTOMATION
                 }
             },
             "spec": {
@@ -313,21 +558,21 @@ class EnhancedCrossplaneResourceGenerator:
                     "region": request.region,
                     "dbInstanceClass": instance_class,
                     "engine": engine,
-                    "engineVersion": self._get_engine_version(engine),
+                    "engineVersion": _ENGINE_VERSIONS.get(engine, _DEFAULT_ENGINE_VERSION),
                     "allocatedStorage": allocated_storage,
                     "storageType": "gp2",
                     "storageEncrypted": True,
-                    "multiAZ": request.environment == "production",
+                    "multiAZ": profile.multi_az,
                     "publiclyAccessible": False,
                     "vpcSecurityGroupIds": [
-                        f"{{{{ .Values.{request.environment}.databaseSecurityGroupId }}}}"
+                        _values_ref(request.environment, "databaseSecurityGroupId")
                     ],
-                    "dbSubnetGroupName": f"{{{{ .Values.{request.environment}.dbSubnetGroupName }}}}",
-                    "backupRetentionPeriod": 7 if request.environment == "production" else 1,
+                    "dbSubnetGroupName": _values_ref(request.environment, "dbSubnetGroupName"),
+                    "backupRetentionPeriod": profile.backup_retention_days,
                     "backupWindow": "03:00-04:00",
                     "maintenanceWindow": "sun:04:00-sun:05:00",
-                    "autoMinorVersionUpgrade": request.environment != "production",
-                    "deletionProtection": request.environment == "production",
+                    "autoMinorVersionUpgrade": profile.auto_minor_version_upgrade,
+                    "deletionProtection": profile.deletion_protection,
                     "tags": tags
                 },
                 "providerConfigRef": {
@@ -342,18 +587,19 @@ class EnhancedCrossplaneResourceGenerator:
         
         return {"database": database}
     
-    def _generate_vpc(self, request: ResourceRequest) -> Dict[str, Any]:
+    def _generate_vpc(self, request: ResourceRequest, created_at: str,
+                      sections: Optional[AbstractSet[str]] = None) -> Dict[str, CrossplaneManifest]:
         """Generate VPC configuration from request"""
         
         # This is a basic VPC setup - in practice, you'd want more sophisticated networking
         vpc = {
-            "apiVersion": "ec2.aws.crossplane.io/v1beta1",
+            "apiVersion": _EC2_API_VERSION,
             "kind": "VPC",
             "metadata": {
                 "name": request.name,
                 "labels": {
                     "environment": request.environment,
-                    "managed-by": "crossplane-automation"
+                    _MANAGED_BY: _CROSSPLANE_AUTOMATION
                 }
             },
             "spec": {
@@ -365,7 +611,7 @@ class EnhancedCrossplaneResourceGenerator:
                     "tags": {
                         "Name": request.name,
                         "Environment": request.environment,
-                        "CreatedBy": "crossplane-automation"
+                        "CreatedBy": _CROSSPLANE_AUTOMATION
                     }
                 },
                 "providerConfigRef": {
@@ -376,14 +622,22 @@ class EnhancedCrossplaneResourceGenerator:
         
         return {"vpc": vpc}
     
-    def _generate_eks_addons(self, request: ResourceRequest) -> Dict[str, Any]:
+    # Per-type generators, keyed by resource type and shared by all instances
+    _DISPATCH = {
+        ResourceType.EKS_CLUSTER: _generate_eks_cluster,
+        ResourceType.S3_BUCKET: _generate_s3_bucket,
+        ResourceType.RDS_DATABASE: _generate_rds_database,
+        ResourceType.VPC: _generate_vpc,
+    }
+    
+    def _generate_eks_addons(self, request: ResourceRequest) -> Dict[str, CrossplaneManifest]:
         """Generate EKS addons for production clusters"""
         
         addons = {}
         
         # AWS Load Balancer Controller
         addons["aws_load_balancer_controller"] = {
-            "apiVersion": "eks.aws.crossplane.io/v1alpha1",
+            "apiVersion": _EKS_API_VERSION,
             "kind": "Addon",
             "metadata": {
                 "name": f"{request.name}-aws-load-balancer-controller"
@@ -399,7 +653,7 @@ class EnhancedCrossplaneResourceGenerator:
         
         # EBS CSI Driver
         addons["ebs_csi_driver"] = {
-            "apiVersion": "eks.aws.crossplane.io/v1alpha1",
+            "apiVersion": _EKS_API_VERSION,
             "kind": "Addon",
             "metadata": {
                 "name": f"{request.name}-ebs-csi-driver"
@@ -415,70 +669,75 @@ class EnhancedCrossplaneResourceGenerator:
         
         return addons
     
-    def _get_default_instance_types(self, environment: str) -> List[str]:
-        """Get default instance types based on environment"""
-        if environment == "production":
-            return ["m6i.large", "m6i.xlarge", "m5.large", "m5.xlarge"]
-        elif environment == "staging":
-            return ["m6i.large", "m5.large", "t3.large"]
-        else:
-            return ["t3.medium", "t3.large"]
-    
-    def _get_default_db_instance_class(self, environment: str) -> str:
-        """Get default database instance class based on environment"""
-        if environment == "production":
-            return "db.t3.medium"
-        elif environment == "staging":
-            return "db.t3.small"
-        else:
-            return "db.t3.micro"
-    
-    def _get_engine_version(self, engine: str) -> str:
-        """Get default engine version"""
-        versions = {
-            "mysql": "8.0.35",
-            "postgres": "15.4",
-            "mariadb": "10.11.5"
+    def _normalize_tags(self, request: ResourceRequest, created_at: str, **extra: str) -> Dict[str, str]:
+        """
+        Build the AWS tags for a resource: standard tags, resource-specific extras, then user tags
+        
+        Args:
+            request: The resource request
+            created_at: Creation timestamp for the CreatedAt tag
+            **extra: Resource-specific tags added after the standard ones
+            
+        Returns:
+            Tag dictionary with user-supplied keys normalized to Title-Case
+        """
+        tags = {
+            "Environment": request.environment,
+            "CreatedBy": _CROSSPLANE_AUTOMATION,
+            "CreatedAt": created_at,
+            **extra
         }
-        return versions.get(engine, "8.0.35")
+        
+        if request.tags:
+            tags.update({_titleize(k): v for k, v in request.tags.items()})
+        
+        return tags
     
     def save_configurations_as_files(self, request: ResourceRequest, 
-                                   configs: Dict[str, Any]) -> List[Dict[str, str]]:
+                                   configs: Dict[str, CrossplaneManifest],
+                                   persist_local: bool = True) -> List[Dict[str, str]]:
         """
         Save configurations to YAML files and return file information for GitHub
         
         Args:
             request: The resource request
             configs: Configuration objects
+            persist_local: Also write each file under output_dir (skip when only pushing to GitHub)
             
         Returns:
             List of file dictionaries with 'path' and 'content' keys
         """
         files = []
+        generated_at = _now_iso()
         
-        for config_name, config in configs.items():
-            # Create filename
-            filename = f"{request.name}-{config_name}.yaml"
-            filepath = self.output_dir / filename
-            
-            # Convert to YAML
-            yaml_content = yaml.dump(config, default_flow_style=False, sort_keys=False)
-            
-            # Add header comment
-            header = f"""# Generated by Crossplane Automation
+        if persist_local and not self._output_dir_created:
+            self.output_dir.mkdir(exist_ok=True)
+            self._output_dir_created = True
+        
+        # Header comment, identical for every file generated from this request
+        header = f"""# Generated by Crossplane Automation
 # Resource: {request.resource_type.value}
 # Name: {request.name}
 # Environment: {request.environment}
-# Generated at: {datetime.now().isoformat()}
+# Generated at: {generated_at}
 # Description: {request.description or 'No description provided'}
 
 """
+        
+        for config_name, config in configs.items():
+            # Create filename
+            filename = f"{request.name}-{config_name}.yaml"
+            filepath = self.output_dir / filename
             
-            full_content = header + yaml_content
+            # Convert to YAML, emitting straight after the header instead of concatenating
+            buffer = io.StringIO()
+            buffer.write(header)
+            yaml.dump(config, buffer, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+            full_content = buffer.getvalue()
             
-            # Save locally
-            with open(filepath, 'w') as f:
-                f.write(full_content)
+            # Save locally in the background
+            if persist_local:
+                self._pending_writes().append(self._writer.submit(filepath, full_content.encode('utf-8')))
             
             # Prepare for GitHub
             github_path = f"crossplane/{request.environment}/{filename}"
@@ -489,6 +748,26 @@ class EnhancedCrossplaneResourceGenerator:
         
         return files
     
+    def _pending_writes(self) -> List[Future]:
+        """Writes the calling thread has queued since its last flush()"""
+        pending = getattr(self._pending, "writes", None)
+        if pending is None:
+            pending = self._pending.writes = []
+        return pending
+    
+    def flush(self):
+        """
+        Wait until the files this thread queued with save_configurations_as_files are on disk
+        
+        Raises:
+            OSError: The first of those files that could not be written
+        """
+        pending = self._pending_writes()
+        self._pending.writes = []
+        errors = [error for error in (future.exception() for future in pending) if error is not None]
+        if errors:
+            raise errors[0]
+    
     def validate_request(self, request: ResourceRequest) -> List[str]:
         """
         Validate a resource request and return any issues
@@ -505,7 +784,7 @@ class EnhancedCrossplaneResourceGenerator:
         if not request.name or len(request.name) < 3:
             issues.append("Resource name must be at least 3 characters long")
         
-        if not request.name.replace('-', '').replace('_', '').isalnum():
+        if not request.name.translate(_NAME_SEPARATORS).isalnum():
             issues.append("Resource name can only contain letters, numbers, hyphens, and underscores")
         
         # EKS specific validation
@@ -518,7 +797,7 @@ class EnhancedCrossplaneResourceGenerator:
             
             if request.kubernetes_version:
                 # Basic version format validation
-                if not re.match(r'^\d+\.\d+(\.\d+)?$', request.kubernetes_version):
+                if not _K8S_VERSION_RE.match(request.kubernetes_version):
                     issues.append("Kubernetes version must be in format X.Y or X.Y.Z")
         
         # S3 specific validation
@@ -527,7 +806,7 @@ class EnhancedCrossplaneResourceGenerator:
             if len(request.name) > 63:
                 issues.append("S3 bucket name cannot exceed 63 characters")
             
-            if not re.match(r'^[a-z0-9.-]+$', request.name):
+            if not _S3_NAME_RE.match(request.name):
                 issues.append("S3 bucket name can only contain lowercase letters, numbers, dots, and hyphens")
         
         # RDS specific validation
@@ -6,12 +6,84 @@ Real GitHub API integration for creating branches, commits, and pull requests
 
 import os
 import base64
+import hashlib
 import json
+import logging
+import secrets
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Maximum number of concurrent blob uploads when committing through the Git Data API
+MAX_BLOB_WORKERS = 8
+
+# Connection pool sizing and retry policy for the shared GitHub API session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_FORCELIST = (429, 502, 503, 504)
+
+# Pause until the rate-limit window resets once fewer requests than this remain
+RATE_LIMIT_BUFFER = 100
+
+# Longest repository path accepted for a committed file
+MAX_PATH_LENGTH = 255
+
+# Items requested per page from list endpoints (GitHub's maximum)
+PAGE_SIZE = 100
+
+# Most GET responses remembered for ETag revalidation; the least recently used is dropped first
+ETAG_CACHE_SIZE = 128
+
+def make_branch_name(branch_prefix: str) -> str:
+    """Build a unique branch name from a prefix, a UTC timestamp and a random suffix"""
+    return f"{branch_prefix}-{time.strftime('%Y%m%d-%H%M%S', time.gmtime())}-{secrets.token_hex(3)}"
+
+# Commits a set of file additions to a branch in a single GraphQL call
+CREATE_COMMIT_ON_BRANCH = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) {
+    commit { oid url }
+  }
+}
+"""
+
+# Maximum number of response body bytes quoted in error messages
+ERROR_BODY_LIMIT = 512
+
+def _error_body(response: requests.Response) -> str:
+    """Decode at most ERROR_BODY_LIMIT bytes of a response body for an error message"""
+    return response.content[:ERROR_BODY_LIMIT].decode('utf-8', errors='replace')
+
+def _content_bytes(content: Union[str, bytes]) -> bytes:
+    """File content as bytes; text is utf-8 encoded"""
+    return content if isinstance(content, bytes) else content.encode('utf-8')
+
+def _git_blob_sha(content: Union[str, bytes]) -> str:
+    """Compute the SHA git assigns to a blob with this content"""
+    data = _content_bytes(content)
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+def enable_console_logging(level: int = logging.INFO):
+    """Print GitHub integration progress messages to stdout"""
+    if not any(getattr(handler, "_console", False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._console = True
+        logger.addHandler(handler)
+    logger.setLevel(level)
 
 class GitHubAPIError(Exception):
     """Custom exception for GitHub API errors"""
@@ -20,59 +92,208 @@ class GitHubAPIError(Exception):
 class GitHubIntegration:
     """Real GitHub API integration for automated PR creation"""
     
-    def __init__(self, token: str, repo_owner: str, repo_name: str):
+    def __init__(self, token: Union[str, List[str]], repo_owner: str, repo_name: str,
+                 rate_buffer: int = RATE_LIMIT_BUFFER):
         """
         Initialize GitHub integration
         
         Args:
-            token: GitHub personal access token
+            token: GitHub personal access token, or a list of tokens to rotate
+                   through so their rate limits add up
             repo_owner: GitHub repository owner/organization
             repo_name: Repository name
+            rate_buffer: Remaining-request threshold below which calls wait for the rate-limit reset
         """
-        self.token = token
+        tokens = [token] if isinstance(token, str) else list(token)
+        if not tokens:
+            raise GitHubAPIError("At least one GitHub token is required")
+        self.token = tokens[0]
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.base_url = "https://api.github.com"
+        self.rate_buffer = rate_buffer
+        self._repo_url = f"{self.base_url}/repos/{repo_owner}/{repo_name}"
+        
+        # Endpoint prefixes, built once instead of on every call
+        self._git_refs_url = f"{self._repo_url}/git/refs"
+        self._heads_url = f"{self._git_refs_url}/heads/"
+        self._ref_heads_url = f"{self._repo_url}/git/ref/heads/"
+        self._commits_url = f"{self._repo_url}/git/commits"
+        self._blobs_url = f"{self._repo_url}/git/blobs"
+        self._trees_url = f"{self._repo_url}/git/trees"
+        self._contents_url = f"{self._repo_url}/contents/"
+        self._pulls_url = f"{self._repo_url}/pulls"
+        self._graphql_url = f"{self.base_url}/graphql"
+        self._default_branch: Optional[str] = None
+        
+        # (url, params) -> (ETag, parsed body, pagination links) of the last 200 for
+        # conditional GETs; 304s don't count against the rate limit
+        self._etag_cache: "OrderedDict[Tuple[str, Tuple], Tuple[str, Any, Dict[str, Any]]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+        # Token pool: rotated per request, with exhausted tokens parked until
+        # their rate-limit reset time
+        self._tokens = deque(tokens)
+        self._token_resets: Dict[str, float] = {}
+        self._token_lock = threading.Lock()
         
         # Set up headers
         self.headers = {
-            "Authorization": f"token {token}",
+            "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json",
             "Content-Type": "application/json"
         }
         
+        # Share one keep-alive connection pool across all API calls and retry
+        # transient 429/5xx responses with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                              max_retries=retry)
+        self.session.mount("https://", adapter)
+        
         # Verify token and repository access
         self._verify_access()
     
+    def _next_token(self) -> str:
+        """
+        Rotate to the next token that is not waiting for its rate limit to reset
+        
+        Returns:
+            The token to use for the next request
+        """
+        with self._token_lock:
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                self._tokens.rotate(-1)
+                token = self._tokens[0]
+                if self._token_resets.get(token, 0) <= now:
+                    return token
+            
+            # Every token is exhausted; wait for the earliest reset
+            token = min(self._tokens, key=lambda t: self._token_resets[t])
+            delay = max(0, self._token_resets.pop(token) - now) + 1
+        logger.warning("⏳ All GitHub tokens are near their rate limit, pausing %.0fs until one resets...", delay)
+        time.sleep(delay)
+        return token
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the session and respect GitHub's rate limits
+        
+        Waits for a secondary rate limit's Retry-After and retries once. When
+        the remaining budget drops below ``rate_buffer`` the current token is
+        parked until its window resets, or, with a single token, the call
+        pauses until then.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to ``requests.Session.request``
+            
+        Returns:
+            The response
+        """
+        token = self.token
+        if len(self._tokens) > 1:
+            token = self._next_token()
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Authorization": f"token {token}"}
+        
+        response = self.session.request(method, url, **kwargs)
+        
+        retry_after = response.headers.get("Retry-After")
+        if response.status_code == 403 and retry_after and retry_after.isdigit():
+            logger.warning("⏳ Secondary rate limit hit, retrying in %ss...", retry_after)
+            time.sleep(int(retry_after))
+            response = self.session.request(method, url, **kwargs)
+        
+        remaining = int(response.headers.get("X-RateLimit-Remaining", "9999"))
+        if remaining < self.rate_buffer:
+            reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+            if len(self._tokens) > 1:
+                with self._token_lock:
+                    self._token_resets[token] = reset
+            else:
+                delay = max(0, reset - time.time()) + 1
+                logger.warning("⏳ %s GitHub API requests left, pausing %.0fs until the limit resets...", remaining, delay)
+                time.sleep(delay)
+        
+        return response
+    
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[requests.Response, Any, Dict[str, Any]]:
+        """
+        GET a URL, revalidating a previously seen response with its ETag
+        
+        Args:
+            url: URL to fetch
+            params: Optional query parameters
+            
+        Returns:
+            The response, its parsed JSON body and its pagination links. When GitHub
+            answers 304 the body and links come from the cache; the body is None
+            for any other non-200 status.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached:
+                self._etag_cache.move_to_end(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        response = self._request("GET", url, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            return response, cached[1], cached[2]
+        if response.status_code != 200:
+            return response, None, {}
+        
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, data, response.links)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return response, data, response.links
+    
     def _verify_access(self):
         """Verify GitHub token and repository access"""
         try:
             # Test repository access
-            url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}"
-            response = requests.get(url, headers=self.headers)
+            response, repo_data, _ = self._cached_get(self._repo_url)
             
             if response.status_code == 404:
                 raise GitHubAPIError(f"Repository {self.repo_owner}/{self.repo_name} not found or no access")
             elif response.status_code == 401:
                 raise GitHubAPIError("Invalid GitHub token")
-            elif response.status_code != 200:
-                raise GitHubAPIError(f"GitHub API error: {response.status_code} - {response.text}")
+            elif repo_data is None:
+                raise GitHubAPIError(f"GitHub API error: {response.status_code} - {_error_body(response)}")
             
-            repo_data = response.json()
-            print(f"✅ Connected to repository: {repo_data['full_name']}")
+            self._default_branch = repo_data["default_branch"]
+            logger.info("✅ Connected to repository: %s", repo_data['full_name'])
             
         except requests.RequestException as e:
             raise GitHubAPIError(f"Failed to connect to GitHub API: {e}")
     
     def get_default_branch(self) -> str:
-        """Get the default branch of the repository"""
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}"
-        response = requests.get(url, headers=self.headers)
-        
-        if response.status_code != 200:
-            raise GitHubAPIError(f"Failed to get repository info: {response.status_code}")
+        """Get the default branch of the repository (fetched once per instance)"""
+        if self._default_branch is None:
+            response, repo_data, _ = self._cached_get(self._repo_url)
+            
+            if repo_data is None:
+                raise GitHubAPIError(f"Failed to get repository info: {response.status_code}")
+            
+            self._default_branch = repo_data["default_branch"]
         
-        return response.json()["default_branch"]
+        return self._default_branch
     
     def create_branch(self, branch_name: str, base_branch: Optional[str] = None) -> str:
         """
@@ -83,39 +304,88 @@ class GitHubIntegration:
             base_branch: Base branch to create from (defaults to default branch)
             
         Returns:
-            SHA of the new branch
+            SHA of the branch head (the existing head if the branch already exists)
+        """
+        return self._create_branch(branch_name, base_branch)[0]
+    
+    def _create_branch(self, branch_name: str, base_branch: Optional[str] = None) -> Tuple[str, bool]:
+        """
+        Create a new branch, reporting whether this call created it
+        
+        Args:
+            branch_name: Name of the new branch
+            base_branch: Base branch to create from (defaults to default branch)
+            
+        Returns:
+            SHA of the branch head, and False if the branch already existed
         """
+        # Check for an existing branch with a bodyless HEAD on the exact ref
+        response = self._request("HEAD", self._ref_heads_url + branch_name)
+        if response.status_code == 200:
+            logger.warning("⚠️  Branch %s already exists, continuing...", branch_name)
+            return self._get_ref_sha(branch_name), False
+        
         if base_branch is None:
             base_branch = self.get_default_branch()
         
         # Get base branch SHA
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/git/refs/heads/{base_branch}"
-        response = requests.get(url, headers=self.headers)
-        
-        if response.status_code != 200:
-            raise GitHubAPIError(f"Failed to get base branch {base_branch}: {response.status_code}")
-        
-        base_sha = response.json()["object"]["sha"]
+        base_sha = self._get_ref_sha(base_branch)
         
         # Create new branch
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/git/refs"
+        url = self._git_refs_url
         data = {
             "ref": f"refs/heads/{branch_name}",
             "sha": base_sha
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._request("POST", url, json=data)
         
         if response.status_code == 422:
-            # Branch might already exist
-            print(f"⚠️  Branch {branch_name} might already exist, continuing...")
-            return base_sha
+            # Branch was created between the check and the POST
+            logger.warning("⚠️  Branch %s already exists, continuing...", branch_name)
+            return self._get_ref_sha(branch_name), False
         elif response.status_code != 201:
-            raise GitHubAPIError(f"Failed to create branch {branch_name}: {response.status_code} - {response.text}")
+            raise GitHubAPIError(f"Failed to create branch {branch_name}: {response.status_code} - {_error_body(response)}")
+        
+        logger.info("✅ Created branch: %s", branch_name)
+        return response.json()["object"]["sha"], True
+    
+    def _get_ref_sha(self, branch: str) -> str:
+        """
+        Get the commit SHA a branch currently points at
+        
+        Args:
+            branch: Branch name
+            
+        Returns:
+            SHA of the branch head commit
+        """
+        url = self._heads_url + branch
+        response = self._request("GET", url)
+        
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to get branch {branch}: {response.status_code}")
         
-        print(f"✅ Created branch: {branch_name}")
         return response.json()["object"]["sha"]
     
+    def _get_commit_tree(self, commit_sha: str) -> str:
+        """
+        Get the tree SHA of a commit
+        
+        Args:
+            commit_sha: Commit SHA
+            
+        Returns:
+            SHA of the commit's root tree
+        """
+        url = f"{self._commits_url}/{commit_sha}"
+        response = self._request("GET", url)
+        
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to get commit {commit_sha}: {response.status_code}")
+        
+        return response.json()["tree"]["sha"]
+    
     def create_or_update_file(self, file_path: str, content: str, commit_message: str, 
                              branch: str) -> Dict[str, Any]:
         """
@@ -130,13 +400,46 @@ class GitHubIntegration:
         Returns:
             Commit information
         """
-        # Encode content to base64
-        encoded_content = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+        return self._put_file(file_path, content, commit_message, branch,
+                              self._get_file_sha(file_path, branch))
+    
+    def _get_file_sha(self, file_path: str, branch: str) -> Optional[str]:
+        """
+        Get the blob SHA of an existing file
+        
+        Args:
+            file_path: Path to the file in the repository
+            branch: Branch to look in
+            
+        Returns:
+            SHA of the file, or None if it does not exist
+        """
+        url = self._contents_url + file_path
+        _, file_data, _ = self._cached_get(url, params={"ref": branch})
         
-        # Check if file exists
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/contents/{file_path}"
-        response = requests.get(url, headers=self.headers, params={"ref": branch})
+        if file_data is not None:
+            return file_data["sha"]
+        return None
+    
+    def _put_file(self, file_path: str, content: str, commit_message: str,
+                  branch: str, sha: Optional[str]) -> Dict[str, Any]:
+        """
+        Write a file through the contents API
+        
+        Args:
+            file_path: Path to the file in the repository
+            content: File content
+            commit_message: Commit message
+            branch: Branch to commit to
+            sha: SHA of the existing file when updating, None when creating
+            
+        Returns:
+            Commit information
+        """
+        # The contents API only accepts base64
+        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
         
+        url = self._contents_url + file_path
         data = {
             "message": commit_message,
             "content": encoded_content,
@@ -144,18 +447,17 @@ class GitHubIntegration:
         }
         
         # If file exists, we need the SHA for updating
-        if response.status_code == 200:
-            file_info = response.json()
-            data["sha"] = file_info["sha"]
-            print(f"📝 Updating existing file: {file_path}")
+        if sha is not None:
+            data["sha"] = sha
+            logger.info("📝 Updating existing file: %s", file_path)
         else:
-            print(f"📝 Creating new file: {file_path}")
+            logger.info("📝 Creating new file: %s", file_path)
         
         # Create or update file
-        response = requests.put(url, headers=self.headers, json=data)
+        response = self._request("PUT", url, json=data)
         
         if response.status_code not in [200, 201]:
-            raise GitHubAPIError(f"Failed to create/update file {file_path}: {response.status_code} - {response.text}")
+            raise GitHubAPIError(f"Failed to create/update file {file_path}: {response.status_code} - {_error_body(response)}")
         
         return response.json()
     
@@ -173,6 +475,22 @@ class GitHubIntegration:
             List of commit information for each file
         """
         commits = []
+        if not files:
+            return commits
+        
+        # Probe which files already exist concurrently; the writes themselves
+        # stay sequential because each one moves the branch head
+        existing = {}
+        with ThreadPoolExecutor(max_workers=min(MAX_BLOB_WORKERS, len(files))) as executor:
+            futures = {
+                executor.submit(self._get_file_sha, file_info['path'], branch): file_info['path']
+                for file_info in files
+            }
+            for future in as_completed(futures):
+                try:
+                    existing[futures[future]] = future.result()
+                except Exception as e:
+                    existing[futures[future]] = e
         
         for file_info in files:
             file_path = file_info['path']
@@ -182,23 +500,261 @@ class GitHubIntegration:
             individual_message = f"{commit_message}\n\nAdd: {file_path}"
             
             try:
-                commit_info = self.create_or_update_file(
+                sha = existing[file_path]
+                if isinstance(sha, Exception):
+                    raise sha
+                commit_info = self._put_file(
                     file_path=file_path,
                     content=content,
                     commit_message=individual_message,
-                    branch=branch
+                    branch=branch,
+                    sha=sha
                 )
                 commits.append(commit_info)
                 
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
-                
             except Exception as e:
-                print(f"⚠️  Failed to commit {file_path}: {e}")
+                logger.warning("⚠️  Failed to commit %s: %s", file_path, e)
                 continue
         
         return commits
     
+    def _create_blob(self, content: Union[str, bytes]) -> str:
+        """
+        Upload file content as a Git blob
+        
+        Text is sent as-is with utf-8 encoding; only binary content is base64 encoded.
+        
+        Args:
+            content: File content
+            
+        Returns:
+            SHA of the created blob
+        """
+        url = self._blobs_url
+        if isinstance(content, bytes):
+            data = {"content": base64.b64encode(content).decode('ascii'), "encoding": "base64"}
+        else:
+            data = {"content": content, "encoding": "utf-8"}
+        
+        response = self._request("POST", url, json=data)
+        
+        if response.status_code != 201:
+            raise GitHubAPIError(f"Failed to create blob: {response.status_code} - {_error_body(response)}")
+        
+        return response.json()["sha"]
+    
+    def _get_tree_blobs(self, tree_sha: str) -> Dict[str, str]:
+        """
+        List the blobs in a tree, recursively
+        
+        Args:
+            tree_sha: SHA of the tree
+            
+        Returns:
+            Mapping of file path to blob SHA
+        """
+        response = self._request("GET", f"{self._trees_url}/{tree_sha}", params={"recursive": 1})
+        
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to get tree {tree_sha}: {response.status_code}")
+        
+        return {entry["path"]: entry["sha"] for entry in response.json()["tree"] if entry["type"] == "blob"}
+    
+    def _changed_files(self, files: List[Dict[str, str]], base_tree_sha: str,
+                       branch: str) -> List[Dict[str, str]]:
+        """
+        Keep only the files whose content differs from the branch's tree
+        
+        Args:
+            files: List of file dictionaries with 'path' and 'content' keys
+            base_tree_sha: SHA of the branch head's tree
+            branch: Branch being committed to (for the error message)
+            
+        Returns:
+            The files that need a blob and a tree entry
+            
+        Raises:
+            GitHubAPIError: Every file already matches the branch
+        """
+        existing = self._get_tree_blobs(base_tree_sha)
+        changed = [file_info for file_info in files
+                   if existing.get(file_info['path']) != _git_blob_sha(file_info['content'])]
+        if not changed:
+            raise GitHubAPIError(f"No changes to commit: all files already match {branch}")
+        return changed
+    
+    def _create_tree(self, base_tree_sha: str, files: List[Dict[str, str]],
+                     blob_shas: List[str]) -> str:
+        """
+        Create a tree that adds the given blobs on top of a base tree
+        
+        Args:
+            base_tree_sha: SHA of the tree to build on
+            files: List of file dictionaries with 'path' (and optional 'mode') keys
+            blob_shas: Blob SHA for each file, in the same order as files
+            
+        Returns:
+            SHA of the new tree
+        """
+        # Assemble the tree in input order
+        tree = [
+            {
+                "path": file_info['path'],
+                "mode": file_info.get('mode', "100644"),
+                "type": "blob",
+                "sha": blob_sha
+            }
+            for file_info, blob_sha in zip(files, blob_shas)
+        ]
+        
+        response = self._request("POST", self._trees_url,
+                                 json={"base_tree": base_tree_sha, "tree": tree})
+        if response.status_code != 201:
+            raise GitHubAPIError(f"Failed to create tree: {response.status_code} - {_error_body(response)}")
+        return response.json()["sha"]
+    
+    def _create_commit(self, message: str, tree_sha: str, parent_sha: str) -> Dict[str, Any]:
+        """
+        Create a commit object
+        
+        Args:
+            message: Commit message
+            tree_sha: SHA of the commit's tree
+            parent_sha: SHA of the parent commit
+            
+        Returns:
+            Commit information
+        """
+        response = self._request("POST", self._commits_url,
+                                 json={"message": message, "tree": tree_sha, "parents": [parent_sha]})
+        if response.status_code != 201:
+            raise GitHubAPIError(f"Failed to create commit: {response.status_code} - {_error_body(response)}")
+        return response.json()
+    
+    def _update_ref(self, branch: str, commit_sha: str):
+        """
+        Move a branch to a commit
+        
+        Args:
+            branch: Branch name
+            commit_sha: SHA of the commit the branch should point at
+        """
+        response = self._request("PATCH", self._heads_url + branch,
+                                 json={"sha": commit_sha})
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to update branch {branch}: {response.status_code} - {_error_body(response)}")
+    
+    def commit_files_tree(self, files: List[Dict[str, str]], commit_message: str,
+                          branch: str) -> Dict[str, Any]:
+        """
+        Commit multiple files to a branch as a single commit using the Git Data API
+        
+        Blobs are uploaded concurrently, then one tree, one commit and one ref
+        update are created, instead of one contents PUT per file.
+        
+        Args:
+            files: List of file dictionaries with 'path' and 'content' keys
+                   (and an optional 'mode', defaulting to a regular file)
+            commit_message: Commit message
+            branch: Branch to commit to
+            
+        Returns:
+            Commit information
+        """
+        if not files:
+            raise GitHubAPIError("No files to commit")
+        
+        # Resolve the branch head and its tree
+        parent_sha = self._get_ref_sha(branch)
+        base_tree_sha = self._get_commit_tree(parent_sha)
+        
+        # Only files whose content differs from the branch need a blob and a tree entry
+        files = self._changed_files(files, base_tree_sha, branch)
+        
+        # Upload all blobs concurrently, failing fast on the first error
+        blob_shas = [None] * len(files)
+        with ThreadPoolExecutor(max_workers=min(MAX_BLOB_WORKERS, len(files))) as executor:
+            futures = {
+                executor.submit(self._create_blob, file_info['content']): index
+                for index, file_info in enumerate(files)
+            }
+            for future in as_completed(futures):
+                blob_shas[futures[future]] = future.result()
+        
+        tree_sha = self._create_tree(base_tree_sha, files, blob_shas)
+        commit_info = self._create_commit(commit_message, tree_sha, parent_sha)
+        self._update_ref(branch, commit_info["sha"])
+        
+        for file_info in files:
+            logger.info("📝 Committed file: %s", file_info['path'])
+        
+        return commit_info
+    
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query or mutation
+        
+        Args:
+            query: GraphQL document
+            variables: Variables for the document
+            
+        Returns:
+            The response's data object
+        """
+        response = self._request("POST", self._graphql_url,
+                                 json={"query": query, "variables": variables})
+        if response.status_code != 200:
+            raise GitHubAPIError(f"GraphQL request failed: {response.status_code} - {_error_body(response)}")
+        
+        result = response.json()
+        if result.get("errors"):
+            messages = "; ".join(error.get("message", str(error)) for error in result["errors"])
+            raise GitHubAPIError(f"GraphQL request failed: {messages}")
+        return result["data"]
+    
+    def commit_files_graphql(self, files: List[Dict[str, str]], commit_message: str,
+                             branch: str) -> Dict[str, Any]:
+        """
+        Commit multiple files to a branch in one createCommitOnBranch mutation
+        
+        Args:
+            files: List of file dictionaries with 'path' and 'content' keys
+            commit_message: Commit message; the first line becomes the headline
+            branch: Branch to commit to
+            
+        Returns:
+            Commit information with 'sha' and 'url'
+        """
+        if not files:
+            raise GitHubAPIError("No files to commit")
+        
+        headline, _, body = commit_message.partition("\n")
+        additions = [
+            {
+                "path": file_info['path'],
+                "contents": base64.b64encode(_content_bytes(file_info['content'])).decode('ascii')
+            }
+            for file_info in files
+        ]
+        
+        data = self._graphql(CREATE_COMMIT_ON_BRANCH, {
+            "input": {
+                "branch": {
+                    "repositoryNameWithOwner": f"{self.repo_owner}/{self.repo_name}",
+                    "branchName": branch
+                },
+                "message": {"headline": headline, "body": body.strip()},
+                "fileChanges": {"additions": additions},
+                "expectedHeadOid": self._get_ref_sha(branch)
+            }
+        })
+        commit = data["createCommitOnBranch"]["commit"]
+        
+        for file_info in files:
+            logger.info("📝 Committed file: %s", file_info['path'])
+        
+        return {"sha": commit["oid"], "url": commit["url"]}
+    
     def create_pull_request(self, title: str, description: str, head_branch: str, 
                           base_branch: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -216,7 +772,7 @@ class GitHubIntegration:
         if base_branch is None:
             base_branch = self.get_default_branch()
         
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls"
+        url = self._pulls_url
         data = {
             "title": title,
             "body": description,
@@ -225,19 +781,53 @@ class GitHubIntegration:
             "maintainer_can_modify": True
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._request("POST", url, json=data)
         
         if response.status_code != 201:
-            raise GitHubAPIError(f"Failed to create pull request: {response.status_code} - {response.text}")
+            raise GitHubAPIError(f"Failed to create pull request: {response.status_code} - {_error_body(response)}")
         
         pr_info = response.json()
-        print(f"🚀 Created Pull Request #{pr_info['number']}: {title}")
-        print(f"🔗 URL: {pr_info['html_url']}")
+        logger.info("🚀 Created Pull Request #%s: %s", pr_info['number'], title)
+        logger.info("🔗 URL: %s", pr_info['html_url'])
         
         return pr_info
     
+    def _validate_files(self, files: List[Dict[str, str]]):
+        """
+        Check files locally before any API call is made
+        
+        Args:
+            files: List of file dictionaries with 'path' and 'content' keys
+        """
+        if not files:
+            raise GitHubAPIError("No files to commit")
+        
+        seen = set()
+        for file_info in files:
+            path = file_info.get('path')
+            if not path or not isinstance(path, str):
+                raise GitHubAPIError(f"Invalid file path: {path!r}")
+            if path.startswith('/') or '..' in path.split('/'):
+                raise GitHubAPIError(f"File path must be relative to the repository root: {path}")
+            if len(path) > MAX_PATH_LENGTH:
+                raise GitHubAPIError(f"File path is longer than {MAX_PATH_LENGTH} characters: {path}")
+            if path in seen:
+                raise GitHubAPIError(f"Duplicate file path: {path}")
+            seen.add(path)
+            
+            content = file_info.get('content')
+            if isinstance(content, str):
+                try:
+                    content.encode('utf-8')
+                except UnicodeEncodeError as e:
+                    raise GitHubAPIError(f"File {path} is not valid UTF-8: {e}")
+            elif not isinstance(content, bytes):
+                raise GitHubAPIError(f"File {path} has no content")
+    
     def create_automated_pr(self, files: List[Dict[str, str]], pr_title: str, 
-                          pr_description: str, branch_prefix: str = "automation") -> Dict[str, Any]:
+                          pr_description: str, branch_prefix: str = "automation",
+                          branch_name: Optional[str] = None,
+                          use_graphql: bool = False) -> Dict[str, Any]:
         """
         Complete automated PR creation workflow
         
@@ -246,31 +836,36 @@ class GitHubIntegration:
             pr_title: Pull request title
             pr_description: Pull request description
             branch_prefix: Prefix for the branch name
+            branch_name: Full branch name to use as-is instead of a generated one
+            use_graphql: Commit with one GraphQL createCommitOnBranch call instead
+                         of the REST blob/tree/commit/ref sequence
             
         Returns:
             Pull request information
         """
+        self._validate_files(files)
+        
         # Generate unique branch name
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        branch_name = f"{branch_prefix}-{timestamp}"
+        if branch_name is None:
+            branch_name = make_branch_name(branch_prefix)
         
+        # Only a branch this call created is deleted again on failure, never a reused one
+        created_branch = False
         try:
             # Step 1: Create branch
-            print(f"🌿 Creating branch: {branch_name}")
-            self.create_branch(branch_name)
+            logger.info("🌿 Creating branch: %s", branch_name)
+            _, created_branch = self._create_branch(branch_name)
             
-            # Step 2: Commit files
-            print(f"📁 Committing {len(files)} files...")
+            # Step 2: Commit all files in a single commit
+            logger.info("📁 Committing %s files...", len(files))
             commit_message = f"Automated: {pr_title}"
-            commits = self.commit_files(files, commit_message, branch_name)
-            
-            if not commits:
-                raise GitHubAPIError("No files were successfully committed")
+            commit = self.commit_files_graphql if use_graphql else self.commit_files_tree
+            commits = [commit(files, commit_message, branch_name)]
             
-            print(f"✅ Successfully committed {len(commits)} files")
+            logger.info("✅ Successfully committed %s files", len(files))
             
             # Step 3: Create pull request
-            print(f"🔄 Creating pull request...")
+            logger.info("🔄 Creating pull request...")
             pr_info = self.create_pull_request(pr_title, pr_description, branch_name)
             
             return {
@@ -280,12 +875,13 @@ class GitHubIntegration:
             }
             
         except Exception as e:
-            print(f"❌ Failed to create automated PR: {e}")
+            logger.error("❌ Failed to create automated PR: %s", e)
             # Attempt to clean up branch if PR creation failed
-            try:
-                self.delete_branch(branch_name)
-            except:
-                pass  # Ignore cleanup errors
+            if created_branch:
+                try:
+                    self.delete_branch(branch_name)
+                except:
+                    pass  # Ignore cleanup errors
             raise
     
     def delete_branch(self, branch_name: str):
@@ -295,17 +891,17 @@ class GitHubIntegration:
         Args:
             branch_name: Name of the branch to delete
         """
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/git/refs/heads/{branch_name}"
-        response = requests.delete(url, headers=self.headers)
+        url = self._heads_url + branch_name
+        response = self._request("DELETE", url)
         
         if response.status_code == 204:
-            print(f"🗑️  Deleted branch: {branch_name}")
+            logger.info("🗑️  Deleted branch: %s", branch_name)
         elif response.status_code != 404:  # 404 means branch doesn't exist
-            print(f"⚠️  Failed to delete branch {branch_name}: {response.status_code}")
+            logger.warning("⚠️  Failed to delete branch %s: %s", branch_name, response.status_code)
     
     def list_pull_requests(self, state: str = "open") -> List[Dict[str, Any]]:
         """
-        List pull requests
+        List pull requests, following pagination across all pages
         
         Args:
             state: PR state (open, closed, all)
@@ -313,15 +909,33 @@ class GitHubIntegration:
         Returns:
             List of pull request information
         """
-        url = f"{self.base_url}/repos/{self.repo_owner}/{self.repo_name}/pulls"
-        params = {"state": state, "per_page": 100}
+        url = self._pulls_url
+        params = {"state": state, "per_page": PAGE_SIZE}
         
-        response = requests.get(url, headers=self.headers, params=params)
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            response, page_data, _ = self._cached_get(url, params={**params, "page": page})
+            if page_data is None:
+                raise GitHubAPIError(f"Failed to list pull requests: {response.status_code}")
+            return page_data
         
-        if response.status_code != 200:
+        response, first_page, links = self._cached_get(url, params=params)
+        
+        if first_page is None:
             raise GitHubAPIError(f"Failed to list pull requests: {response.status_code}")
         
-        return response.json()
+        # Copy the first page: the cached body must not grow with the later pages
+        pull_requests = list(first_page)
+        
+        # The "last" link tells us how many pages there are, so fetch the rest concurrently
+        last_url = links.get("last", {}).get("url")
+        if last_url:
+            last_page = int(parse_qs(urlparse(last_url).query)["page"][0])
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=min(MAX_BLOB_WORKERS, last_page - 1)) as executor:
+                    for page in executor.map(fetch_page, range(2, last_page + 1)):
+                        pull_requests.extend(page)
+        
+        return pull_requests
 
 def test_github_integration():
     """Test function for GitHub integration (requires real token)"""
@@ -342,6 +956,8 @@ def test_github_integration():
         print("❌ Missing required environment variables")
         return
     
+    enable_console_logging()
+    
     try:
         github = GitHubIntegration(token, repo_owner, repo_name)
         
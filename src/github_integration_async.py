@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Async GitHub Integration for Crossplane Automation
+asyncio front end over GitHubIntegration for callers running an event loop
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any
+
+from .github_integration import GitHubIntegration, GitHubAPIError, MAX_BLOB_WORKERS, make_branch_name, logger
+
+class AsyncGitHubIntegration:
+    """asyncio wrapper around GitHubIntegration for automated PR creation"""
+    
+    def __init__(self, github: GitHubIntegration, max_workers: int = MAX_BLOB_WORKERS):
+        """
+        Initialize async GitHub integration
+        
+        Args:
+            github: Connected GitHubIntegration whose pooled session is shared
+            max_workers: Maximum number of API calls in flight at once
+        """
+        self.github = github
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking GitHubIntegration call without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def create_branch(self, branch_name: str, base_branch: Optional[str] = None) -> str:
+        """Create a new branch (see GitHubIntegration.create_branch)"""
+        return await self._call(self.github.create_branch, branch_name, base_branch)
+    
+    async def create_pull_request(self, title: str, description: str, head_branch: str,
+                                  base_branch: Optional[str] = None) -> Dict[str, Any]:
+        """Create a pull request (see GitHubIntegration.create_pull_request)"""
+        return await self._call(self.github.create_pull_request, title, description,
+                                head_branch, base_branch)
+    
+    async def commit_files_tree(self, files: List[Dict[str, str]], commit_message: str,
+                                branch: str) -> Dict[str, Any]:
+        """
+        Commit multiple files to a branch as a single commit using the Git Data API
+        
+        Args:
+            files: List of file dictionaries with 'path' and 'content' keys
+            commit_message: Commit message
+            branch: Branch to commit to
+        
+        Returns:
+            Commit information
+        """
+        if not files:
+            raise GitHubAPIError("No files to commit")
+        
+        github = self.github
+        parent_sha = await self._call(github._get_ref_sha, branch)
+        base_tree_sha = await self._call(github._get_commit_tree, parent_sha)
+        
+        # Only files whose content differs from the branch need a blob and a tree entry
+        files = await self._call(github._changed_files, files, base_tree_sha, branch)
+        
+        blob_shas = await asyncio.gather(
+            *[self._call(github._create_blob, file_info['content']) for file_info in files]
+        )
+        
+        tree_sha = await self._call(github._create_tree, base_tree_sha, files, blob_shas)
+        commit_info = await self._call(github._create_commit, commit_message, tree_sha, parent_sha)
+        await self._call(github._update_ref, branch, commit_info["sha"])
+        
+        for file_info in files:
+            logger.info("📝 Committed file: %s", file_info['path'])
+        
+        return commit_info
+    
+    async def create_automated_pr(self, files: List[Dict[str, str]], pr_title: str,
+                                  pr_description: str, branch_prefix: str = "automation",
+                                  branch_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Complete automated PR creation workflow
+        
+        Args:
+            files: List of file dictionaries with 'path' and 'content' keys
+            pr_title: Pull request title
+            pr_description: Pull request description
+            branch_prefix: Prefix for the branch name
+            branch_name: Full branch name to use as-is instead of a generated one
+        
+        Returns:
+            Pull request information
+        """
+        self.github._validate_files(files)
+        
+        if branch_name is None:
+            branch_name = make_branch_name(branch_prefix)
+        
+        # Only a branch this call created is deleted again on failure, never a reused one
+        created_branch = False
+        try:
+            logger.info("🌿 Creating branch: %s", branch_name)
+            _, created_branch = await self._call(self.github._create_branch, branch_name)
+            
+            logger.info("📁 Committing %s files...", len(files))
+            commit_info = await self.commit_files_tree(files, f"Automated: {pr_title}", branch_name)
+            logger.info("✅ Successfully committed %s files", len(files))
+            
+            logger.info("🔄 Creating pull request...")
+            pr_info = await self.create_pull_request(pr_title, pr_description, branch_name)
+            
+            return {
+                "branch": branch_name,
+                "commits": [commit_info],
+                "pull_request": pr_info
+            }
+        
+        except Exception as e:
+            logger.error("❌ Failed to create automated PR: %s", e)
+            if created_branch:
+                try:
+                    await self._call(self.github.delete_branch, branch_name)
+                except Exception:
+                    pass  # Ignore cleanup errors
+            raise
+    
+    def create_automated_pr_sync(self, *args, **kwargs) -> Dict[str, Any]:
+        """Run create_automated_pr from synchronous code"""
+        return asyncio.run(self.create_automated_pr(*args, **kwargs))
+    
+    def close(self):
+        """Shut down the worker threads"""
+        self._executor.shutdown(wait=True)
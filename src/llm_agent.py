@@ -4,14 +4,33 @@ LLM Agent for Crossplane Resource Generation
 Parses natural language requests and generates appropriate infrastructure configurations
 """
 
+import hashlib
 import json
+import logging
+import os
 import re
-import openai
-import requests
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Callable, Final
+from dataclasses import dataclass, replace
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+def enable_console_logging(level: int = logging.INFO):
+    """Print LLM agent progress messages to stdout"""
+    if not any(getattr(handler, "_console", False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._console = True
+        logger.addHandler(handler)
+    logger.setLevel(level)
+
 class LLMParsingError(Exception):
     """Exception raised when LLM parsing fails"""
     pass
@@ -22,59 +41,13 @@ class ResourceType(Enum):
     RDS_DATABASE = "rds_database"
     VPC = "vpc"
 
-@dataclass
-class ResourceRequest:
-    """Structured representation of a resource request"""
-    resource_type: ResourceType
-    name: str
-    region: str = "us-east-1"
-    environment: str = "development"
-    
-    # EKS specific
-    node_count: Optional[int] = None
-    kubernetes_version: Optional[str] = None
-    instance_types: Optional[List[str]] = None
-    
-    # S3 specific
-    versioning: Optional[bool] = None
-    encryption: Optional[bool] = None
-    
-    # RDS specific
-    engine: Optional[str] = None
-    instance_class: Optional[str] = None
-    allocated_storage: Optional[int] = None
-    
-    # General
-    tags: Optional[Dict[str, str]] = None
-    description: Optional[str] = None
+# Direct value -> member lookup for decoding LLM responses without going through Enum.__call__
+_RESOURCE_TYPES_BY_VALUE: Dict[str, ResourceType] = {member.value: member for member in ResourceType}
 
-class LLMAgent:
-    """LLM-powered agent for parsing infrastructure requests"""
-    
-    def __init__(self, api_key: str, model: str = "gpt-5"):
-        """
-        Initialize the LLM agent
-        
-        Args:
-            api_key: OpenAI API key
-            model: Model to use (gpt-4, gpt-3.5-turbo, etc.)
-        """
-        openai.api_key = api_key
-        self.api_key = api_key
-        self.model = model
-        
-    def parse_request(self, user_input: str) -> ResourceRequest:
-        """
-        Parse natural language input into a structured ResourceRequest
-        
-        Args:
-            user_input: Natural language description of infrastructure needs
-            
-        Returns:
-            ResourceRequest object with parsed parameters
-        """
-        
-        system_prompt = """
+# System prompt shared by every model. It is kept byte-for-byte identical across
+# calls, with the request as the only varying tail, so the provider can serve the
+# prefix from its prompt cache
+SYSTEM_PROMPT: Final = """
 You are an expert infrastructure engineer specializing in AWS and Kubernetes. Your job is to parse natural language requests for cloud infrastructure and extract structured information.
 
 Given a user's request, extract the following information and return it as JSON:
@@ -132,125 +105,552 @@ Response: {
 }
 """
 
+# Structured-output schema for the GPT-5 HTTP path
+_RESOURCE_REQUEST_JSON_SCHEMA = {
+    "name": "resource_request",
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": ["resource_type", "name"],
+        "properties": {
+            "resource_type": {
+                "type": "string",
+                "enum": ["eks_cluster", "s3_bucket", "rds_database", "vpc"]
+            },
+            "name": {"type": "string"},
+            "region": {"type": "string"},
+            "environment": {
+                "type": "string",
+                "enum": ["development", "staging", "production"]
+            },
+            "node_count": {"type": "integer"},
+            "kubernetes_version": {"type": "string"},
+            "instance_types": {"type": "array", "items": {"type": "string"}},
+            "versioning": {"type": "boolean"},
+            "encryption": {"type": "boolean"},
+            "engine": {"type": "string"},
+            "instance_class": {"type": "string"},
+            "allocated_storage": {"type": "integer"},
+            "tags": {"type": "object", "additionalProperties": {"type": "string"}},
+            "description": {"type": "string"}
+        }
+    }
+}
+
+# response_format values sent with every GPT-5 request; shared rather than rebuilt per call
+_RESPONSE_FORMAT_SCHEMA = {"type": "json_schema", "json_schema": _RESOURCE_REQUEST_JSON_SCHEMA}
+_RESPONSE_FORMAT_JSON = {"type": "json_object"}
+
+# Top-level string fields that can be picked out of a partially streamed JSON response
+_STREAMED_FIELD_RE = re.compile(r'"(resource_type|name)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Strict grammar for templated requests that can be parsed without an LLM call, e.g.
+# "Create an EKS cluster called analytics-cluster for production in us-west-2 with 5 nodes"
+def _fast_path_pattern(noun: str, suffix: str = "") -> "re.Pattern":
+    return re.compile(
+        r"^\s*(?:create|provision|deploy|set\s+up)\s+(?:an?\s+)?"
+        r"(?:(?P<env>development|staging|production)\s+)?"
+        + noun +
+        r"\s+(?:called|named)\s+(?P<name>[a-z0-9][a-z0-9-]*)"
+        r"(?:\s+for\s+(?P<env_for>development|staging|production))?"
+        r"(?:\s+in\s+(?P<region>(?:us|eu|ap|ca|sa|me|af)-[a-z]+-\d))?"
+        + suffix +
+        r"\s*\.?\s*$",
+        re.IGNORECASE,
+    )
+
+_FAST_PATH_PATTERNS = {
+    ResourceType.EKS_CLUSTER: _fast_path_pattern(
+        r"(?:eks\s+|kubernetes\s+)?cluster",
+        r"(?:\s+with\s+(?P<nodes>\d+)\s+nodes?)?",
+    ),
+    ResourceType.S3_BUCKET: _fast_path_pattern(r"(?:s3\s+)?bucket"),
+    ResourceType.RDS_DATABASE: _fast_path_pattern(r"(?:(?P<engine>mysql|postgres)\s+)?(?:rds\s+)?database"),
+    ResourceType.VPC: _fast_path_pattern(r"vpc"),
+}
+
+# Bump whenever the system prompts or response schema change so cached parses are not reused
+PROMPT_VERSION = 2
+
+# Exact-match parse cache: an in-process LRU, optionally backed by one JSON file per request
+# on disk (LLMAgent(persist_cache=True)); disk entries are never expired, so persistence is opt-in
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_DIR = Path(os.getenv("CROSSPLANE_AGENT_CACHE_DIR",
+                                 Path.home() / ".cache" / "crossplane-agent" / "llm"))
+
+_parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+def _parse_cache_key(model: str, user_input: str) -> str:
+    """Key a parse result by prompt version, model and the exact request text"""
+    return hashlib.sha256(f"{PROMPT_VERSION}\x1f{model}\x1f{user_input}".encode("utf-8")).hexdigest()
+
+def _parse_cache_get(key: str, use_disk: bool = True) -> Optional[Dict[str, Any]]:
+    """Look up a parsed LLM response in memory, then (when use_disk is set) on disk"""
+    with _parse_cache_lock:
+        parsed_data = _parse_cache.get(key)
+        if parsed_data is not None:
+            _parse_cache.move_to_end(key)
+            return parsed_data
+    
+    if not use_disk:
+        return None
+    try:
+        parsed_data = json.loads((PARSE_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    
+    _parse_cache_put(key, parsed_data, persist=False)
+    return parsed_data
+
+def _parse_cache_put(key: str, parsed_data: Dict[str, Any], persist: bool = True):
+    """Store a parsed LLM response in memory and, optionally, on disk"""
+    with _parse_cache_lock:
+        _parse_cache[key] = parsed_data
+        _parse_cache.move_to_end(key)
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    
+    if not persist:
+        return
+    tmp_path = None
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A uniquely named temp file per write, so concurrent threads and processes never share one
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=PARSE_CACHE_DIR,
+                                         suffix=".tmp", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+            tmp_file.write(json.dumps(parsed_data))
+        os.replace(tmp_path, PARSE_CACHE_DIR / f"{key}.json")
+    except OSError:
+        # The disk cache is best effort
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+# Patterns for the regex fallback parser (keywords match anywhere in the lowercased input)
+# One left-to-right pass finds every resource keyword; the zero-width lookahead lets
+# keywords overlap (e.g. "s3" inside "rds3"), matching the old substring checks
+_FALLBACK_TYPE_RE = re.compile(
+    r"(?=(?P<s3_bucket>bucket|s3|storage)"
+    r"|(?P<rds_database>database|db|rds|mysql|postgres)"
+    r"|(?P<vpc>vpc|network|subnet))"
+)
+# Highest priority first when a request mentions several resource kinds
+_FALLBACK_TYPE_PRIORITY = (ResourceType.S3_BUCKET, ResourceType.RDS_DATABASE, ResourceType.VPC)
+_FALLBACK_PRODUCTION_RE = re.compile(r"prod")
+_FALLBACK_STAGING_RE = re.compile(r"staging|stage")
+_FALLBACK_NAME_RE = re.compile(r"(?:called|named)\s+([a-zA-Z0-9-]+)")
+_FALLBACK_NOUN_NAME_RE = re.compile(r"([a-zA-Z0-9-]+)(?:\s+cluster|\s+bucket|\s+database)")
+_FALLBACK_SANITIZE_RE = re.compile(r"[^a-zA-Z0-9-]")
+_FALLBACK_REGION_RE = re.compile(r"(us-[a-z]+-\d+|eu-[a-z]+-\d+|ap-[a-z]+-\d+)")
+_FALLBACK_NODES_RE = re.compile(r"(\d+)\s+nodes?")
+
+# Keep-alive connections kept open to the OpenAI API per agent
+HTTP_POOL_SIZE = 10
+
+# Default number of requests a batch parse keeps in flight at once
+MAX_PARSE_CONCURRENCY = 8
+
+# GPT-5 completion budget: the first attempt gets COMPLETION_TOKENS_HEADROOM times the
+# running average of completion tokens the model has needed, but never less than
+# MIN_COMPLETION_TOKENS; DEFAULT_COMPLETION_TOKENS is used until there is an average
+MIN_COMPLETION_TOKENS = 256
+DEFAULT_COMPLETION_TOKENS = 512
+COMPLETION_TOKENS_HEADROOM = 1.5
+COMPLETION_TOKENS_EMA_WEIGHT = 0.2
+
+# Phrasing-insensitive cache keys: filler words are dropped and common synonyms are
+# mapped onto one spelling, while names, regions and numbers are kept verbatim
+_PROMPT_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9._-]*")
+_PROMPT_STOPWORDS = frozenset({
+    "a", "an", "the", "please", "can", "could", "would", "you", "i", "we", "me",
+    "our", "my", "some", "new", "up", "just", "kindly", "to", "for", "in", "with",
+})
+_PROMPT_SYNONYMS = {
+    "make": "create", "provision": "create", "deploy": "create", "build": "create",
+    "spin": "create", "set": "create", "setup": "create", "need": "create", "want": "create",
+    "named": "called", "db": "database", "k8s": "kubernetes",
+    "prod": "production", "dev": "development", "stage": "staging",
+}
+
+def _normalize_prompt(user_input: str) -> str:
+    """Reduce a request to its significant words, e.g. "Make me an EKS cluster" -> "create eks cluster" """
+    words = []
+    for token in _PROMPT_TOKEN_RE.findall(user_input.lower()):
+        token = token.rstrip(".")
+        if token in _PROMPT_STOPWORDS:
+            continue
+        token = _PROMPT_SYNONYMS.get(token, token)
+        if not words or words[-1] != token:
+            words.append(token)
+    return " ".join(words)
+
+# __slots__ for dataclasses is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ResourceRequest:
+    """Structured representation of a resource request"""
+    resource_type: ResourceType
+    name: str
+    region: str = "us-east-1"
+    environment: str = "development"
+    
+    # EKS specific
+    node_count: Optional[int] = None
+    kubernetes_version: Optional[str] = None
+    instance_types: Optional[List[str]] = None
+    
+    # S3 specific
+    versioning: Optional[bool] = None
+    encryption: Optional[bool] = None
+    
+    # RDS specific
+    engine: Optional[str] = None
+    instance_class: Optional[str] = None
+    allocated_storage: Optional[int] = None
+    
+    # General
+    tags: Optional[Dict[str, str]] = None
+    description: Optional[str] = None
+    
+    def replace(self, **changes) -> "ResourceRequest":
+        """Return a copy with the given fields changed (instances are immutable)"""
+        return replace(self, **changes)
+
+# Type-specific ResourceRequest fields read from an LLM response for each resource type
+_RESOURCE_FIELDS = {
+    ResourceType.EKS_CLUSTER: ("node_count", "kubernetes_version", "instance_types"),
+    ResourceType.S3_BUCKET: ("versioning", "encryption"),
+    ResourceType.RDS_DATABASE: ("engine", "instance_class", "allocated_storage"),
+    ResourceType.VPC: (),
+}
+
+# Inputs whose regex fallback parse is memoized; ResourceRequest is immutable and the
+# fallback never sets tags or instance types, so cached instances are safe to share
+FALLBACK_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=FALLBACK_CACHE_SIZE)
+def _fallback_parse(user_input: str) -> ResourceRequest:
+    """Parse a request with regex patterns when the LLM is unavailable"""
+    
+    lowered = user_input.lower()
+    
+    # Determine resource type
+    found = set()
+    for match in _FALLBACK_TYPE_RE.finditer(lowered):
+        found.add(match.lastgroup)
+        if match.lastgroup == "s3_bucket":
+            break
+    resource_type = next((kind for kind in _FALLBACK_TYPE_PRIORITY if kind.value in found),
+                         ResourceType.EKS_CLUSTER)
+    
+    # Extract name
+    name_match = _FALLBACK_NAME_RE.search(user_input) or _FALLBACK_NOUN_NAME_RE.search(user_input)
+    
+    name = name_match.group(1) if name_match else "default-resource"
+    name = _FALLBACK_SANITIZE_RE.sub('-', name).lower()
+    
+    # Extract region
+    region_match = _FALLBACK_REGION_RE.search(user_input)
+    region = region_match.group(1) if region_match else "us-east-1"
+    
+    # Extract environment
+    environment = "development"  # default
+    if _FALLBACK_PRODUCTION_RE.search(lowered):
+        environment = "production"
+    elif _FALLBACK_STAGING_RE.search(lowered):
+        environment = "staging"
+    
+    # Extract node count for clusters
+    node_count = None
+    if resource_type == ResourceType.EKS_CLUSTER:
+        node_match = _FALLBACK_NODES_RE.search(user_input)
+        node_count = int(node_match.group(1)) if node_match else 3
+    
+    return ResourceRequest(
+        resource_type=resource_type,
+        name=name,
+        region=region,
+        environment=environment,
+        node_count=node_count,
+        kubernetes_version="1.28" if resource_type == ResourceType.EKS_CLUSTER else None,
+        description=f"Parsed from: {user_input[:100]}..."
+    )
+
+class LLMAgent:
+    """LLM-powered agent for parsing infrastructure requests"""
+    
+    # Running average of completion tokens per model, shared by every agent in the process
+    _avg_completion_tokens: Dict[str, float] = {}
+    
+    def __init__(self, api_key: str, model: str = "gpt-5", enable_cache: bool = True,
+                 enable_semantic_cache: bool = False, persist_cache: bool = False):
+        """
+        Initialize the LLM agent
+        
+        Args:
+            api_key: OpenAI API key
+            model: Model to use (gpt-4, gpt-3.5-turbo, etc.)
+            enable_cache: Reuse LLM results for exactly repeated requests
+            enable_semantic_cache: Also reuse results for rephrasings of a cached request
+                                   that differ only in filler words and common synonyms
+            persist_cache: Also keep cached results on disk under PARSE_CACHE_DIR so they are
+                           reused across processes (entries are never expired)
+        """
+        self.api_key = api_key
+        self.model = model
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}"
+        }
+        self.enable_cache = enable_cache
+        self.enable_semantic_cache = enable_cache and enable_semantic_cache
+        self.persist_cache = enable_cache and persist_cache
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    def _http_session(self):
+        """
+        Get the keep-alive HTTP session used for OpenAI calls, creating it on first use
+        
+        requests is imported lazily so ResourceRequest/ResourceType stay cheap to import.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+    
+    async def parse_requests_async(self, user_inputs: List[str],
+                                   max_concurrency: int = MAX_PARSE_CONCURRENCY) -> List[ResourceRequest]:
+        """
+        Parse several requests concurrently
+        
+        Each request runs parse_request on a worker thread, so N prompts take
+        roughly as long as the slowest one instead of the sum of all of them.
+        All workers share the agent's keep-alive session.
+        
+        Args:
+            user_inputs: Natural language descriptions of infrastructure needs
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            ResourceRequest objects in the same order as the inputs
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        if not user_inputs:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(user_inputs))) as executor:
+            return list(await asyncio.gather(
+                *[loop.run_in_executor(executor, self.parse_request, user_input) for user_input in user_inputs]
+            ))
+    
+    def parse_requests(self, user_inputs: List[str],
+                       max_concurrency: int = MAX_PARSE_CONCURRENCY) -> List[ResourceRequest]:
+        """
+        Parse several requests concurrently from synchronous code
+        
+        Args:
+            user_inputs: Natural language descriptions of infrastructure needs
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            ResourceRequest objects in the same order as the inputs
+        """
+        import asyncio
+        
+        return asyncio.run(self.parse_requests_async(user_inputs, max_concurrency))
+    
+    def _cache_keys(self, user_input: str) -> List[str]:
+        """Parse cache keys for a request, most specific first"""
+        if not self.enable_cache:
+            return []
+        keys = [_parse_cache_key(self.model, user_input)]
+        if self.enable_semantic_cache:
+            keys.append(_parse_cache_key(self.model, "\x1e" + _normalize_prompt(user_input)))
+        return keys
+    
+    def _cached_request(self, cache_keys: List[str]) -> Optional[ResourceRequest]:
+        """Return the cached parse for the first key that hits, if any; unreadable entries count as misses"""
+        for key in cache_keys:
+            try:
+                parsed_data = _parse_cache_get(key, use_disk=self.persist_cache)
+                if parsed_data is not None:
+                    return self._request_from_dict(parsed_data)
+            except Exception as e:
+                logger.warning("⚠️  Ignoring unreadable parse cache entry (%s)", e)
+        return None
+    
+    def _store_parse(self, cache_keys: List[str], parsed_data: Dict[str, Any]) -> ResourceRequest:
+        """Build the ResourceRequest for an LLM response and cache the response under every key"""
+        request = self._request_from_dict(parsed_data)
+        for key in cache_keys:
+            _parse_cache_put(key, parsed_data, persist=self.persist_cache)
+        return request
+        
+    def try_fast_parse(self, user_input: str) -> Optional[ResourceRequest]:
+        """
+        Parse a templated request deterministically, without calling the LLM
+        
+        Only requests that fully match one of the known sentence templates are
+        handled; anything ambiguous returns None so the caller can use the LLM.
+        
+        Args:
+            user_input: Natural language description of infrastructure needs
+            
+        Returns:
+            ResourceRequest object, or None if the input is not a templated request
+        """
+        for resource_type, pattern in _FAST_PATH_PATTERNS.items():
+            match = pattern.match(user_input)
+            if not match:
+                continue
+            
+            fields = match.groupdict()
+            if fields["env"] and fields["env_for"] and fields["env"].lower() != fields["env_for"].lower():
+                return None
+            
+            extra: Dict[str, Any] = {}
+            if resource_type == ResourceType.EKS_CLUSTER:
+                extra["node_count"] = int(fields["nodes"]) if fields["nodes"] else 3
+                extra["kubernetes_version"] = "1.28"
+            elif resource_type == ResourceType.RDS_DATABASE and fields["engine"]:
+                extra["engine"] = fields["engine"].lower()
+            
+            return ResourceRequest(
+                resource_type=resource_type,
+                name=fields["name"].lower(),
+                region=(fields["region"] or "us-east-1").lower(),
+                environment=(fields["env"] or fields["env_for"] or "development").lower(),
+                tags={},
+                description=f"Parsed from: {user_input.strip()}",
+                **extra
+            )
+        
+        return None
+    
+    def parse_request(self, user_input: str, fast_path: bool = True) -> ResourceRequest:
+        """
+        Parse natural language input into a structured ResourceRequest
+        
+        Args:
+            user_input: Natural language description of infrastructure needs
+            fast_path: Try the request templates before the cache and the LLM
+            
+        Returns:
+            ResourceRequest object with parsed parameters
+        """
+        if fast_path:
+            request = self.try_fast_parse(user_input)
+            if request is not None:
+                return request
+        
+        cache_keys = self._cache_keys(user_input)
+        cached = self._cached_request(cache_keys)
+        if cached is not None:
+            return cached
+        
         try:
             # Use HTTP path for GPT-5 family to support new params (max_completion_tokens)
             if str(self.model).startswith("gpt-5"):
-                # Ultra-compact system prompt to minimize input tokens
-                compact_system_prompt = "Return JSON only."
-
+                session = self._http_session()
+                
                 def build_payload(max_tokens: int, use_schema: bool = True):
                     payload = {
                         "model": self.model,
                         "messages": [
-                            {"role": "system", "content": compact_system_prompt},
+                            {"role": "system", "content": SYSTEM_PROMPT},
                             {"role": "user", "content": user_input}
                         ],
-                        "max_completion_tokens": max_tokens
+                        "max_completion_tokens": max_tokens,
+                        "response_format": _RESPONSE_FORMAT_SCHEMA if use_schema else _RESPONSE_FORMAT_JSON
                     }
                     
-                    if use_schema:
-                        payload["response_format"] = {
-                            "type": "json_schema",
-                            "json_schema": {
-                                "name": "resource_request",
-                                "schema": {
-                                    "type": "object",
-                                    "additionalProperties": False,
-                                    "required": ["resource_type", "name"],
-                                    "properties": {
-                                        "resource_type": {
-                                            "type": "string",
-                                            "enum": ["eks_cluster", "s3_bucket", "rds_database", "vpc"]
-                                        },
-                                        "name": {"type": "string"},
-                                        "region": {"type": "string"},
-                                        "environment": {
-                                            "type": "string",
-                                            "enum": ["development", "staging", "production"]
-                                        },
-                                        "node_count": {"type": "integer"},
-                                        "kubernetes_version": {"type": "string"},
-                                        "instance_types": {"type": "array", "items": {"type": "string"}},
-                                        "versioning": {"type": "boolean"},
-                                        "encryption": {"type": "boolean"},
-                                        "engine": {"type": "string"},
-                                        "instance_class": {"type": "string"},
-                                        "allocated_storage": {"type": "integer"},
-                                        "tags": {"type": "object", "additionalProperties": {"type": "string"}},
-                                        "description": {"type": "string"}
-                                    }
-                                }
-                            }
-                        }
-                    else:
-                        payload["response_format"] = {"type": "json_object"}
-                    
                     return payload
 
-                headers = {
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}"
-                }
-
                 # Progressive retry strategy: more tokens, then simpler format, then fallback model
+                start_tok = self._completion_budget()
                 attempts = [
-                    (512, True),   # 512 tokens with schema
-                    (1024, True),  # 1024 tokens with schema
-                    (1024, False), # 1024 tokens with simple json_object
+                    (start_tok, True),       # learned budget with schema
+                    (start_tok * 2, True),   # double the budget with schema
+                    (start_tok * 2, False),  # double the budget with simple json_object
                 ]
                 
-                content = ""
-                last_data = None
                 last_finish = None
                 
                 for max_tok, use_schema in attempts:
                     try:
                         payload = build_payload(max_tok, use_schema)
-                        resp = requests.post(
+                        resp = session.post(
                             "https://api.openai.com/v1/chat/completions",
-                            headers=headers,
-                            data=json.dumps(payload),
+                            headers=self._headers,
+                            json=payload,
                             timeout=60
                         )
                         resp.raise_for_status()
                         data = resp.json()
-                        last_data = data
                         
-                        # Print raw response for debugging
-                        schema_type = "schema" if use_schema else "json_object"
-                        print(f"🔄 LLM raw response (HTTP, {max_tok} tokens, {schema_type}):")
-                        try:
-                            print(json.dumps(data, indent=2, ensure_ascii=False))
-                        except Exception:
-                            print(f"Non-JSON response: {data}")
+                        # Log the raw response for debugging, formatting it only when someone is listening
+                        if logger.isEnabledFor(logging.DEBUG):
+                            schema_type = "schema" if use_schema else "json_object"
+                            try:
+                                raw = json.dumps(data, indent=2, ensure_ascii=False)
+                            except Exception:
+                                raw = f"Non-JSON response: {data}"
+                            logger.debug("🔄 LLM raw response (HTTP, %s tokens, %s):\n%s", max_tok, schema_type, raw)
                         
                         content = data["choices"][0]["message"].get("content", "") or ""
                         content = content.strip()
                         last_finish = data["choices"][0].get("finish_reason")
                         
+                        # A response cut off at the token limit is never valid JSON, so
+                        # move straight on to the next, larger attempt instead of parsing it
+                        if last_finish == "length":
+                            logger.warning("⚠️ Response truncated at %s tokens, retrying with a larger budget", max_tok)
+                            self._record_completion_tokens(max_tok)
+                            content = ""
+                            continue
+                        
                         if content:
+                            completion_tokens = (data.get("usage") or {}).get("completion_tokens")
+                            if completion_tokens:
+                                self._record_completion_tokens(completion_tokens)
                             break
                             
                     except Exception as e:
-                        print(f"⚠️ Attempt failed (tokens={max_tok}, schema={use_schema}): {e}")
-                        continue
-
-                # If still no content, try fallback to gpt-3.5-turbo
-                if not content:
-                    print("🔄 GPT-5 failed, falling back to gpt-3.5-turbo...")
-                    fallback_agent = LLMAgent(self.api_key, "gpt-3.5-turbo")
-                    return fallback_agent.parse_request(user_input)
-
-                if not content:
-                    raise LLMParsingError(
-                        f"LLM returned empty content after all attempts (finish_reason={last_finish})."
-                    )
+                        logger.warning("⚠️ Attempt failed (tokens=%s, schema=%s): %s", max_tok, use_schema, e)
+                else:
+                    # No GPT-5 attempt produced content: fall back to gpt-3.5-turbo over the same session
+                    logger.warning("🔄 GPT-5 failed, falling back to gpt-3.5-turbo...")
+                    content = self._call_legacy(user_input)
+                    if not content:
+                        raise LLMParsingError(
+                            "LLM returned empty content from gpt-3.5-turbo after all GPT-5 attempts "
+                            f"(last GPT-5 finish_reason={last_finish})."
+                        )
             else:
                 # Legacy SDK path for older models (e.g., gpt-3.5-turbo, gpt-4)
+                import openai
+                openai.api_key = self.api_key
+                
                 response = openai.ChatCompletion.create(
                     model=self.model,
                     messages=[
-                        {"role": "system", "content": system_prompt},
+                        {"role": "system", "content": SYSTEM_PROMPT},
                         {"role": "user", "content": user_input}
                     ],
                     temperature=0.1,
@@ -260,98 +660,227 @@ Response: {
                 # Extract JSON from response
                 content = response.choices[0].message.content.strip()
             
-            # Try to extract JSON if it's wrapped in markdown
-            json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-            if json_match:
-                content = json_match.group(1)
-            elif content.startswith('```') and content.endswith('```'):
-                content = content[3:-3].strip()
-            
-            if not content:
-                raise LLMParsingError("LLM returned empty content.")
-            
-            try:
-                parsed_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                raise LLMParsingError(f"LLM output is not valid JSON: {e}") from e
-            
-            # Convert to ResourceRequest
-            resource_type = ResourceType(parsed_data["resource_type"])
-            
-            request = ResourceRequest(
-                resource_type=resource_type,
-                name=parsed_data["name"],
-                region=parsed_data.get("region", "us-east-1"),
-                environment=parsed_data.get("environment", "development"),
-                node_count=parsed_data.get("node_count"),
-                kubernetes_version=parsed_data.get("kubernetes_version"),
-                instance_types=parsed_data.get("instance_types"),
-                versioning=parsed_data.get("versioning"),
-                encryption=parsed_data.get("encryption"),
-                engine=parsed_data.get("engine"),
-                instance_class=parsed_data.get("instance_class"),
-                allocated_storage=parsed_data.get("allocated_storage"),
-                tags=parsed_data.get("tags", {}),
-                description=parsed_data.get("description")
-            )
-            
-            return request
+            return self._store_parse(cache_keys, self._extract_json(content))
             
         except LLMParsingError as e:
             # Don't fall back to regex for LLM parsing errors - raise them directly
             raise e
         except Exception as e:
             # Fallback: try to extract basic information using regex for other errors
-            print(f"⚠️  LLM parsing failed ({e}), falling back to regex parsing...")
+            logger.warning("⚠️  LLM parsing failed (%s), falling back to regex parsing...", e)
             return self._fallback_parse(user_input)
     
-    def _fallback_parse(self, user_input: str) -> ResourceRequest:
-        """Fallback parsing using regex patterns"""
+    def _completion_budget(self) -> int:
+        """max_completion_tokens for the first GPT-5 attempt, learned from earlier responses"""
+        average = LLMAgent._avg_completion_tokens.get(self.model)
+        if average is None:
+            return DEFAULT_COMPLETION_TOKENS
+        return max(MIN_COMPLETION_TOKENS, int(average * COMPLETION_TOKENS_HEADROOM))
+    
+    def _record_completion_tokens(self, tokens: int):
+        """Fold the completion tokens a response needed into the per-model running average"""
+        average = LLMAgent._avg_completion_tokens.get(self.model)
+        if average is None:
+            average = float(tokens)
+        else:
+            average += COMPLETION_TOKENS_EMA_WEIGHT * (tokens - average)
+        LLMAgent._avg_completion_tokens[self.model] = average
+    
+    def _call_legacy(self, user_input: str, model: str = "gpt-3.5-turbo") -> str:
+        """
+        Ask a pre-GPT-5 chat model for the JSON response, reusing the keep-alive session
         
-        # Determine resource type
-        resource_type = ResourceType.EKS_CLUSTER  # default
-        if any(word in user_input.lower() for word in ["bucket", "s3", "storage"]):
-            resource_type = ResourceType.S3_BUCKET
-        elif any(word in user_input.lower() for word in ["database", "db", "rds", "mysql", "postgres"]):
-            resource_type = ResourceType.RDS_DATABASE
-        elif any(word in user_input.lower() for word in ["vpc", "network", "subnet"]):
-            resource_type = ResourceType.VPC
-        
-        # Extract name
-        name_match = re.search(r'(?:called|named)\s+([a-zA-Z0-9-]+)', user_input)
-        if not name_match:
-            name_match = re.search(r'([a-zA-Z0-9-]+)(?:\s+cluster|\s+bucket|\s+database)', user_input)
-        
-        name = name_match.group(1) if name_match else "default-resource"
-        name = re.sub(r'[^a-zA-Z0-9-]', '-', name).lower()
-        
-        # Extract region
-        region_match = re.search(r'(us-[a-z]+-\d+|eu-[a-z]+-\d+|ap-[a-z]+-\d+)', user_input)
-        region = region_match.group(1) if region_match else "us-east-1"
-        
-        # Extract environment
-        environment = "development"  # default
-        if any(word in user_input.lower() for word in ["prod", "production"]):
-            environment = "production"
-        elif any(word in user_input.lower() for word in ["staging", "stage"]):
-            environment = "staging"
-        
-        # Extract node count for clusters
-        node_count = None
-        if resource_type == ResourceType.EKS_CLUSTER:
-            node_match = re.search(r'(\d+)\s+nodes?', user_input)
-            node_count = int(node_match.group(1)) if node_match else 3
+        Args:
+            user_input: Natural language description of infrastructure needs
+            model: Chat model that accepts max_tokens and temperature
+            
+        Returns:
+            The raw response content
+        """
+        resp = self._http_session().post(
+            "https://api.openai.com/v1/chat/completions",
+            headers=self._headers,
+            json={
+                "model": model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_input}
+                ],
+                "temperature": 0.1,
+                "max_tokens": 500
+            },
+            timeout=60
+        )
+        resp.raise_for_status()
+        return (resp.json()["choices"][0]["message"].get("content") or "").strip()
+    
+    def parse_request_streaming(self, user_input: str,
+                                on_fields: Optional[Callable[[Dict[str, str]], bool]] = None,
+                                fast_path: bool = True) -> ResourceRequest:
+        """
+        Parse natural language input while streaming the LLM response
+        
+        As soon as the top-level ``resource_type`` and ``name`` fields have been
+        streamed, ``on_fields`` is called with them so the caller can start
+        validating before the rest of the response arrives. Returning False from
+        the callback stops reading the stream and raises LLMParsingError.
+        
+        Only the GPT-5 HTTP path supports streaming; other models, and streams
+        that end without content, fall back to parse_request.
+        
+        Args:
+            user_input: Natural language description of infrastructure needs
+            on_fields: Optional callback receiving the early top-level fields
+            fast_path: Try the request templates before the cache and the LLM
+            
+        Returns:
+            ResourceRequest object with parsed parameters
+        """
+        if not str(self.model).startswith("gpt-5"):
+            return self.parse_request(user_input, fast_path=fast_path)
+        
+        if fast_path:
+            request = self.try_fast_parse(user_input)
+            if request is not None:
+                return request
+        
+        cache_keys = self._cache_keys(user_input)
+        cached = self._cached_request(cache_keys)
+        if cached is not None:
+            return cached
+        
+        session = self._http_session()
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_input}
+            ],
+            "max_completion_tokens": 1024,
+            "response_format": _RESPONSE_FORMAT_SCHEMA,
+            "stream": True
+        }
+        
+        chunks = []
+        fields: Dict[str, str] = {}
+        fields_reported = on_fields is None
+        
+        try:
+            with session.post("https://api.openai.com/v1/chat/completions", headers=self._headers,
+                              json=payload, stream=True, timeout=60) as resp:
+                resp.raise_for_status()
+                
+                for line in resp.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data: "):
+                        continue
+                    data = line[len("data: "):]
+                    if data == "[DONE]":
+                        break
+                    
+                    choices = json.loads(data).get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if not delta:
+                        continue
+                    chunks.append(delta)
+                    
+                    if fields_reported:
+                        continue
+                    
+                    partial = "".join(chunks)
+                    for match in _STREAMED_FIELD_RE.finditer(partial):
+                        # Only accept keys at the top level of the object, not e.g. a "name" tag
+                        depth = partial.count("{", 0, match.start()) - partial.count("}", 0, match.start())
+                        if depth == 1:
+                            fields.setdefault(match.group(1), json.loads(f'"{match.group(2)}"'))
+                    
+                    if "resource_type" in fields and "name" in fields:
+                        fields_reported = True
+                        if on_fields(fields) is False:
+                            raise LLMParsingError(
+                                f"Request rejected while streaming: {fields['resource_type']} '{fields['name']}'"
+                            )
+        except LLMParsingError:
+            raise
+        except Exception as e:
+            logger.warning("⚠️  Streaming failed (%s), retrying without streaming...", e)
+            return self.parse_request(user_input, fast_path=False)
+        
+        content = "".join(chunks).strip()
+        if not content:
+            logger.warning("⚠️  Streaming returned no content, retrying without streaming...")
+            return self.parse_request(user_input, fast_path=False)
+        
+        try:
+            return self._store_parse(cache_keys, self._extract_json(content))
+        except LLMParsingError:
+            raise
+        except Exception as e:
+            logger.warning("⚠️  LLM parsing failed (%s), falling back to regex parsing...", e)
+            return self._fallback_parse(user_input)
+    
+    def _extract_json(self, content: str) -> Dict[str, Any]:
+        """
+        Decode the JSON object in raw LLM output
+        
+        Args:
+            content: LLM response content, optionally wrapped in a markdown code block
+            
+        Returns:
+            The decoded JSON object
+        """
+        # Strip a markdown code fence (```json ... ``` or plain ``` ... ```) if present
+        start = content.find("```json")
+        if start != -1:
+            start += len("```json")
+        elif content.startswith("```"):
+            start = len("```")
+        if start != -1:
+            end = content.find("```", start)
+            content = content[start:end if end != -1 else len(content)].strip()
+        
+        if not content:
+            raise LLMParsingError("LLM returned empty content.")
+        
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError as e:
+            raise LLMParsingError(f"LLM output is not valid JSON: {e}") from e
+    
+    def _request_from_dict(self, parsed_data: Dict[str, Any]) -> ResourceRequest:
+        """
+        Convert a decoded LLM response into a ResourceRequest
+        
+        Args:
+            parsed_data: JSON object returned by the LLM
+            
+        Returns:
+            ResourceRequest object with parsed parameters
+        """
+        # Convert to ResourceRequest; copy the containers so cached data is never shared
+        resource_type = _RESOURCE_TYPES_BY_VALUE.get(parsed_data["resource_type"])
+        if resource_type is None:
+            raise ValueError(f"{parsed_data['resource_type']!r} is not a valid ResourceType")
+        specific = {field: parsed_data[field] for field in _RESOURCE_FIELDS[resource_type]
+                    if parsed_data.get(field) is not None}
+        if "instance_types" in specific:
+            specific["instance_types"] = list(specific["instance_types"])
+        tags = parsed_data.get("tags", {})
         
         return ResourceRequest(
             resource_type=resource_type,
-            name=name,
-            region=region,
-            environment=environment,
-            node_count=node_count,
-            kubernetes_version="1.28" if resource_type == ResourceType.EKS_CLUSTER else None,
-            description=f"Parsed from: {user_input[:100]}..."
+            name=parsed_data["name"],
+            region=parsed_data.get("region", "us-east-1"),
+            environment=parsed_data.get("environment", "development"),
+            tags=dict(tags) if tags is not None else None,
+            description=parsed_data.get("description"),
+            **specific
         )
     
+    def _fallback_parse(self, user_input: str) -> ResourceRequest:
+        """Fallback parsing using regex patterns"""
+        return _fallback_parse(user_input)
+    
     def generate_enhancement_suggestions(self, request: ResourceRequest) -> List[str]:
         """
         Generate suggestions for improving the resource configuration
@@ -11,8 +11,15 @@ import sys
 import yaml
 from datetime import datetime
 from pathlib import Path
+from string import Template
 from typing import Dict, Any, List
 
+try:
+    from .yaml_support import Dumper as _Dumper
+except ImportError:
+    # Run directly as a script rather than imported from the src package
+    from yaml_support import Dumper as _Dumper
+
 class CrossplaneResourceGenerator:
     """Generates Crossplane YAML configurations for AWS resources"""
     
@@ -24,12 +31,15 @@ class CrossplaneResourceGenerator:
                            node_count: int = 3, version: str = "1.28") -> Dict[str, Any]:
         """Generate EKS cluster configuration"""
         
+        # One provider config name for every manifest of the cluster
+        provider_config_name = f"{name}-aws-provider-config"
+        
         # Provider configuration
         provider_config = {
             "apiVersion": "aws.crossplane.io/v1beta1",
             "kind": "ProviderConfig",
             "metadata": {
-                "name": f"{name}-aws-provider-config"
+                "name": provider_config_name
             },
             "spec": {
                 "credentials": {
@@ -86,7 +96,7 @@ class CrossplaneResourceGenerator:
                     }
                 },
                 "providerConfigRef": {
-                    "name": f"{name}-aws-provider-config"
+                    "name": provider_config_name
                 }
             }
         }
@@ -121,7 +131,7 @@ class CrossplaneResourceGenerator:
                     }
                 },
                 "providerConfigRef": {
-                    "name": f"{name}-aws-provider-config"
+                    "name": provider_config_name
                 }
             }
         }
@@ -173,20 +183,22 @@ class CrossplaneResourceGenerator:
         
         return {"bucket": bucket}
     
-    def save_configurations(self, resource_type: str, name: str, configs: Dict[str, Any]) -> List[str]:
-        """Save configurations to YAML files"""
-        files_created = []
+    def _write_configuration(self, name: str, config_name: str, config: Dict[str, Any]) -> str:
+        """Dump one configuration to its YAML file and return the file path"""
+        filename = f"{name}-{config_name}.yaml"
+        filepath = self.output_dir / filename
         
-        for config_name, config in configs.items():
-            filename = f"{name}-{config_name}.yaml"
-            filepath = self.output_dir / filename
-            
-            with open(filepath, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-            
-            files_created.append(str(filepath))
+        # Emit the whole document in memory, then write it out in one call
+        content = yaml.dump(config, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+        with open(filepath, 'w') as f:
+            f.write(content)
         
-        return files_created
+        return str(filepath)
+    
+    def save_configurations(self, resource_type: str, name: str, configs: Dict[str, Any]) -> List[str]:
+        """Save configurations to YAML files"""
+        return [self._write_configuration(name, config_name, config)
+                for config_name, config in configs.items()]
 
 class GitHubPRGenerator:
     """Generates GitHub Pull Requests for Crossplane configurations"""
@@ -215,6 +227,36 @@ class GitHubPRGenerator:
         
         return pr_url
 
+# Pull request body for generated resources, parsed once at import
+_PR_DESCRIPTION_TEMPLATE = Template("""## Resource Request
+
+**Type**: ${resource_title}
+**Name**: ${name}
+**Region**: ${region}
+**Environment**: ${environment}
+
+## Changes
+
+This PR adds Crossplane configurations for the requested ${resource_type}.
+
+## Files Added
+
+${files_block}
+
+## Review Checklist
+
+- [ ] Resource naming follows conventions
+- [ ] Security configurations are appropriate
+- [ ] Resource limits and scaling are reasonable
+- [ ] Tags and labels are properly set
+- [ ] Environment-specific configurations are correct
+
+## Deployment
+
+Once approved and merged, Crossplane will automatically provision the requested resources.
+
+**⚠️ Note**: This will create actual AWS resources and incur costs.""")
+
 def main():
     parser = argparse.ArgumentParser(description="Generate Crossplane resources and GitHub PRs")
     parser.add_argument("resource_type", choices=["cluster", "bucket", "database"], 
@@ -269,36 +311,14 @@ def main():
         
         branch_name = f"add-{args.resource_type}-{args.name}"
         title = f"Add {args.resource_type.title()}: {args.name}"
-        description = f"""
-## Resource Request
-
-**Type**: {args.resource_type.title()}
-**Name**: {args.name}
-**Region**: {args.region}
-**Environment**: {args.environment}
-
-## Changes
-
-This PR adds Crossplane configurations for the requested {args.resource_type}.
-
-## Files Added
-
-{chr(10).join([f"- {file}" for file in files_created])}
-
-## Review Checklist
-
-- [ ] Resource naming follows conventions
-- [ ] Security configurations are appropriate
-- [ ] Resource limits and scaling are reasonable
-- [ ] Tags and labels are properly set
-- [ ] Environment-specific configurations are correct
-
-## Deployment
-
-Once approved and merged, Crossplane will automatically provision the requested resources.
-
-**⚠️ Note**: This will create actual AWS resources and incur costs.
-        """.strip()
+        description = _PR_DESCRIPTION_TEMPLATE.substitute(
+            resource_title=args.resource_type.title(),
+            resource_type=args.resource_type,
+            name=args.name,
+            region=args.region,
+            environment=args.environment,
+            files_block="\n".join(f"- {file}" for file in files_created)
+        )
         
         pr_url = pr_generator.create_pr(branch_name, title, description, files_created)
         
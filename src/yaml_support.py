@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+YAML helpers shared by the Crossplane resource generators
+The YAML dumper used to write manifests
+"""
+
+# Use the libyaml C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
@@ -6,36 +6,102 @@ Provides a web interface for natural language infrastructure requests
 
 import os
 import json
-import uuid
+import secrets
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
 from flask import Flask, render_template, request, jsonify, redirect, url_for
-import threading
 import time
 
 # Import our workflow components
 from src.agentic_workflow import CrossplaneAgenticWorkflow
 from src.llm_agent import ResourceType
+from src.enhanced_resource_generator import EnhancedCrossplaneResourceGenerator
 
 app = Flask(__name__)
 
-# Global workflow status storage
-workflow_status = {}
+# /status is polled continuously: emit compact JSON in insertion order instead of the
+# indented, key-sorted output Flask produces in debug mode
+app.json.compact = True
+app.json.sort_keys = False
+
+# Resource generator shared by all workflows (it holds no per-request state)
+resource_generator = EnhancedCrossplaneResourceGenerator()
+
+# Global workflow status storage, oldest first. Once it holds more than
+# MAX_TRACKED_WORKFLOWS entries the oldest finished workflows are forgotten;
+# queued and running ones are always kept so their worker can still report back.
+MAX_TRACKED_WORKFLOWS = 1024
+workflow_status = OrderedDict()
+workflow_status_lock = threading.Lock()
+
+# Workflows run on a bounded pool of reused threads; extra submissions wait in its queue
+MAX_WORKFLOW_WORKERS = 8
+workflow_executor = ThreadPoolExecutor(max_workers=MAX_WORKFLOW_WORKERS, thread_name_prefix="workflow")
+atexit.register(workflow_executor.shutdown, wait=False)
+
+def track_workflow(workflow_id: str, status: Dict[str, Any]):
+    """Start tracking a workflow, evicting the oldest finished ones beyond the limit"""
+    with workflow_status_lock:
+        workflow_status[workflow_id] = status
+        excess = len(workflow_status) - MAX_TRACKED_WORKFLOWS
+        if excess <= 0:
+            return
+        finished = [wid for wid, entry in workflow_status.items()
+                    if entry.get('status') in ('completed', 'error')][:excess]
+        for wid in finished:
+            del workflow_status[wid]
+
+@lru_cache(maxsize=1)
+def workflow_credentials() -> MappingProxyType:
+    """Read the workflow credentials from the environment once (read-only)"""
+    return MappingProxyType({
+        'openai_api_key': os.getenv('OPENAI_API_KEY'),
+        'github_token': os.getenv('GITHUB_TOKEN'),
+        'repo_owner': os.getenv('GITHUB_REPO_OWNER'),
+        'repo_name': os.getenv('GITHUB_REPO_NAME')
+    })
+
+@lru_cache(maxsize=1)
+def check_configuration() -> MappingProxyType:
+    """Check if required environment variables are configured (read-only, computed once)"""
+    credentials = workflow_credentials()
+    return MappingProxyType({
+        'openai_configured': bool(credentials['openai_api_key']),
+        'github_configured': bool(credentials['github_token']),
+        'repo_owner': credentials['repo_owner'] or '',
+        'repo_name': credentials['repo_name'] or ''
+    })
+
+def refresh_configuration():
+    """Re-read the environment, e.g. after credentials were rotated or in tests that change it"""
+    workflow_credentials.cache_clear()
+    check_configuration.cache_clear()
+
+def request_to_dict(parsed_request) -> Dict[str, Any]:
+    """Convert a parsed ResourceRequest into JSON-ready data (done once, when the workflow finishes)"""
+    data = asdict(parsed_request)
+    data['resource_type'] = parsed_request.resource_type.value
+    return data
 
-def check_configuration():
-    """Check if required environment variables are configured"""
-    return {
-        'openai_configured': bool(os.getenv('OPENAI_API_KEY')),
-        'github_configured': bool(os.getenv('GITHUB_TOKEN')),
-        'repo_owner': os.getenv('GITHUB_REPO_OWNER', ''),
-        'repo_name': os.getenv('GITHUB_REPO_NAME', '')
-    }
+def update_workflow(workflow_id: str, fields: Dict[str, Any]):
+    """Update a tracked workflow's status while no request handler is reading it"""
+    with workflow_status_lock:
+        entry = workflow_status.get(workflow_id)
+        if entry is not None:
+            entry.update(fields)
 
 def run_workflow_async(workflow_id: str, user_input: str, config: Dict[str, str]):
     """Run the workflow asynchronously and update status"""
     try:
         # Update status to running
-        workflow_status[workflow_id].update({
+        update_workflow(workflow_id, {
             'status': 'running',
             'stage': 'initializing',
             'message': 'Initializing workflow...',
@@ -48,7 +114,9 @@ def run_workflow_async(workflow_id: str, user_input: str, config: Dict[str, str]
             github_token=config['github_token'],
             repo_owner=config['repo_owner'],
             repo_name=config['repo_name'],
-            llm_model="gpt-5"
+            llm_model="gpt-5",
+            buffered_output=True,
+            resource_generator=resource_generator
         )
         
         # Run the workflow
@@ -69,27 +137,27 @@ def run_workflow_async(workflow_id: str, user_input: str, config: Dict[str, str]
             if 'files' in result:
                 formatted_result['files'] = [file['path'] for file in result['files']]
             
-            # Extract parsed request
+            # Extract parsed request, serialized here so status polls don't have to
             if 'request' in result:
-                formatted_result['request'] = result['request']
+                formatted_result['request'] = request_to_dict(result['request'])
         
         # Update final status
         final_status = 'completed' if result and result.get('status') == 'success' else 'error'
         final_message = result.get('message', 'Workflow completed successfully') if final_status == 'completed' else result.get('error', 'Workflow failed')
         
-        workflow_status[workflow_id].update({
+        final_fields = {
             'status': final_status,
             'stage': 'completed',
             'message': final_message,
             'result': formatted_result if formatted_result else result,
             'completed_at': datetime.now().isoformat()
-        })
-        
+        }
         if final_status == 'error' and result:
-            workflow_status[workflow_id]['error'] = result.get('error', str(result))
+            final_fields['error'] = result.get('error', str(result))
+        update_workflow(workflow_id, final_fields)
         
     except Exception as e:
-        workflow_status[workflow_id].update({
+        update_workflow(workflow_id, {
             'status': 'error',
             'stage': 'error',
             'message': f'Workflow failed: {str(e)}',
@@ -117,10 +185,10 @@ def submit_request():
         return jsonify({'error': 'OpenAI API key or GitHub token not configured'}), 400
     
     # Generate workflow ID
-    workflow_id = str(uuid.uuid4())
+    workflow_id = secrets.token_hex(16)
     
     # Initialize workflow status
-    workflow_status[workflow_id] = {
+    track_workflow(workflow_id, {
         'id': workflow_id,
         'prompt': user_input,
         'status': 'queued',
@@ -128,22 +196,10 @@ def submit_request():
         'message': 'Workflow queued for processing',
         'created_at': datetime.now().isoformat(),
         'paused': False
-    }
-    
-    # Start workflow in background thread
-    workflow_config = {
-        'openai_api_key': os.getenv('OPENAI_API_KEY'),
-        'github_token': os.getenv('GITHUB_TOKEN'),
-        'repo_owner': os.getenv('GITHUB_REPO_OWNER'),
-        'repo_name': os.getenv('GITHUB_REPO_NAME')
-    }
+    })
     
-    thread = threading.Thread(
-        target=run_workflow_async,
-        args=(workflow_id, user_input, workflow_config)
-    )
-    thread.daemon = True
-    thread.start()
+    # Start workflow on a background worker
+    workflow_executor.submit(run_workflow_async, workflow_id, user_input, workflow_credentials())
     
     return jsonify({
         'workflow_id': workflow_id,
@@ -154,48 +210,32 @@ def submit_request():
 @app.route('/status/<workflow_id>')
 def get_workflow_status(workflow_id):
     """Get workflow status"""
-    if workflow_id not in workflow_status:
-        return jsonify({'error': 'Workflow not found'}), 404
-    
-    status = workflow_status[workflow_id].copy()
-    
-    # Handle ResourceType serialization
-    if 'result' in status and status['result']:
-        result = status['result'].copy()
-        if 'request' in result and hasattr(result['request'], 'resource_type'):
-            if hasattr(result['request'].resource_type, 'value'):
-                result['request'] = {
-                    'resource_type': result['request'].resource_type.value,
-                    'name': result['request'].name,
-                    'region': result['request'].region,
-                    'environment': result['request'].environment,
-                    'node_count': result['request'].node_count,
-                    'kubernetes_version': result['request'].kubernetes_version,
-                    'instance_types': result['request'].instance_types,
-                    'versioning': result['request'].versioning,
-                    'encryption': result['request'].encryption,
-                    'engine': result['request'].engine,
-                    'instance_class': result['request'].instance_class,
-                    'allocated_storage': result['request'].allocated_storage,
-                    'tags': result['request'].tags,
-                    'description': result['request'].description
-                }
-        status['result'] = result
-    
-    return jsonify(status)
+    with workflow_status_lock:
+        status = workflow_status.get(workflow_id)
+        if status is None:
+            return jsonify({'error': 'Workflow not found'}), 404
+        
+        # The parsed request is stored JSON-ready, so the entry serializes as-is
+        return jsonify(status)
 
 @app.route('/workflows')
 def workflows():
     """List all workflows"""
-    return render_template('workflows.html', workflows=workflow_status)
+    with workflow_status_lock:
+        workflows = OrderedDict(workflow_status)
+    return render_template('workflows.html', workflows=workflows)
 
 @app.route('/workflow/<workflow_id>')
 def workflow_detail(workflow_id):
     """Show detailed workflow information"""
-    if workflow_id not in workflow_status:
+    # Copy the entry so the template never sees a half-applied update_workflow()
+    with workflow_status_lock:
+        workflow = workflow_status.get(workflow_id)
+        if workflow is not None:
+            workflow = dict(workflow)
+    if workflow is None:
         return "Workflow not found", 404
     
-    workflow = workflow_status[workflow_id]
     return render_template('workflow_detail.html', workflow=workflow)
 
 @app.route('/examples')
@@ -207,7 +247,7 @@ def examples():
 def api_config():
     """API endpoint to check configuration"""
     config = check_configuration()
-    return jsonify(config)
+    return jsonify(dict(config))
 
 if __name__ == '__main__':
     print("🌐 Starting Crossplane Agentic Automation Web Interface...")